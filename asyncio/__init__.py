@@ -23,13 +23,55 @@ _attrs = {
     "wait_for": "funcs",
     "wait_for_ms": "funcs",
     "gather": "funcs",
+    "gather_iter": "funcs",
+    "map_concurrent": "funcs",
+    "wait": "funcs",
+    "as_completed": "funcs",
+    "FIRST_COMPLETED": "funcs",
+    "FIRST_EXCEPTION": "funcs",
+    "ALL_COMPLETED": "funcs",
+    "timeout": "funcs",
+    "timeout_at": "funcs",
+    "Timeout": "funcs",
     "Event": "event",
     "ThreadSafeFlag": "event",
     "Lock": "lock",
+    "Condition": "condition",
+    "Barrier": "barrier",
+    "BrokenBarrierError": "barrier",
+    "RWLock": "rwlock",
+    "Semaphore": "semaphore",
+    "BoundedSemaphore": "semaphore",
+    "Queue": "queue",
+    "LifoQueue": "queue",
+    "PriorityQueue": "queue",
+    "QueueEmpty": "queue",
+    "QueueFull": "queue",
+    "TaskGroup": "taskgroup",
+    "set_priority_policy": "priority",
+    "set_deadline": "edf",
+    "sleep_ms_deadline": "edf",
+    "deadline_misses": "edf",
+    "Ticker": "ticker",
+    "enable_metrics": "metrics",
+    "disable_metrics": "metrics",
+    "metrics_snapshot": "metrics",
+    "start_watchdog": "debug",
+    "stop_watchdog": "debug",
+    "dump_tasks": "debug",
+    "enable_task_tracking": "debug",
+    "disable_task_tracking": "debug",
+    "ExceptionAggregator": "exchandler",
+    "Tracer": "trace",
+    "TraceRecorder": "trace",
+    "add_tracer": "trace",
+    "remove_tracer": "trace",
+    "Profiler": "profiler",
     "open_connection": "stream",
     "start_server": "stream",
     "StreamReader": "stream",
     "StreamWriter": "stream",
+    "ConnectionPool": "pool",
 }
 
 
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Barriers
+========
+"""
+
+from . import core
+from .waitqueue import WaitQueue
+
+
+class BrokenBarrierError(RuntimeError):
+    """Raised by `Barrier.wait` when the barrier is aborted or reset while a
+    task is waiting, or is in the broken state.
+    """
+
+
+class Barrier:
+    """Create a new barrier for *parties* tasks.  Each task calls `Barrier.wait`,
+    and they are all released together once *parties* tasks are waiting.  The
+    barrier can then be used again.
+    """
+
+    def __init__(self, parties):
+        if parties < 1:
+            raise ValueError("parties must be > 0")
+        self.parties = parties
+        # Number of tasks waiting in the current cycle
+        self._count = 0
+        # Queue of Tasks waiting for the current cycle to complete
+        self.waiting = WaitQueue("barrier")
+        # The current cycle, whose single item is set to True if it was broken
+        self._cycle = [False]
+        self._broken = False
+
+    @property
+    def n_waiting(self):
+        """The number of tasks waiting on the barrier."""
+
+        return self._count
+
+    @property
+    def broken(self):
+        """``True`` if the barrier is in the broken state."""
+
+        return self._broken
+
+    def _release(self, broken):
+        # End the current cycle, waking all the tasks waiting on it.
+        self._cycle[0] = broken
+        self._cycle = [False]
+        self._count = 0
+        self.waiting.wake_all()
+
+    async def wait(self):
+        """Wait until *parties* tasks are waiting on the barrier, then release
+        them all.  Returns a different index for each task, from 0 to
+        ``parties - 1``.
+
+        Raises `BrokenBarrierError` if the barrier is broken, or is aborted or
+        reset while waiting.
+        """
+
+        if self._broken:
+            raise BrokenBarrierError
+        index = self._count
+        self._count += 1
+        if self._count == self.parties:
+            # The last task to arrive releases the others.
+            self._release(False)
+            return index
+        cycle = self._cycle
+        self.waiting.push(core.cur_task)
+        # Set calling task's data to the barrier's queue so it can be removed if needed
+        core.cur_task.data = self.waiting
+        try:
+            await core._never()
+        except core.CancelledError as er:
+            if cycle is self._cycle:
+                # Still waiting for the cycle to complete, so leave it.
+                self._count -= 1
+            raise er
+        if cycle[0]:
+            raise BrokenBarrierError
+        return index
+
+    async def reset(self):
+        """Return the barrier to the empty state.  Any tasks waiting on it get
+        a `BrokenBarrierError`.
+        """
+
+        if self._count:
+            self._release(True)
+        self._broken = False
+
+    async def abort(self):
+        """Put the barrier into the broken state.  Any tasks waiting on it, and
+        any later calls to `Barrier.wait`, get a `BrokenBarrierError`.
+        """
+
+        self._broken = True
+        self._release(True)
@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Conditions
+==========
+"""
+
+from . import core
+from .lock import Lock
+from .waitqueue import WaitQueue
+
+
+class Condition:
+    """Create a new condition variable, which lets tasks wait until they are
+    notified of a change made by another task.  The condition is associated with
+    *lock*, or with a new `Lock` if *lock* is ``None``; the lock must be held when
+    waiting on or notifying the condition.
+
+    Only the tasks chosen by `Condition.notify` are woken, rather than every
+    waiting task.
+
+    In addition to the methods below, conditions can be used in an ``async
+    with`` statement, which acquires and releases the lock.
+    """
+
+    def __init__(self, lock=None):
+        if lock is None:
+            lock = Lock()
+        self._lock = lock
+        # Queue of Tasks waiting to be notified
+        self.waiting = WaitQueue("condition")
+        # Tasks that have been notified and scheduled to run
+        self._woken = set()
+
+    def locked(self):
+        """Returns ``True`` if the underlying lock is locked, otherwise ``False``."""
+
+        return self._lock.locked()
+
+    async def acquire(self):
+        """Acquire the underlying lock."""
+
+        return await self._lock.acquire()
+
+    def release(self):
+        """Release the underlying lock."""
+
+        self._lock.release()
+
+    async def __aenter__(self):
+        return await self._lock.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self._lock.release()
+
+    async def wait(self):
+        """Release the underlying lock and wait until notified, then acquire the
+        lock again before returning ``True``.  The lock is acquired again even if
+        the waiting task is cancelled.
+        """
+
+        if not self._lock.locked():
+            raise RuntimeError("cannot wait on un-acquired lock")
+        self._lock.release()
+        try:
+            self.waiting.push(core.cur_task)
+            # Set calling task's data to the condition's queue so it can be removed if needed
+            core.cur_task.data = self.waiting
+            try:
+                await core._never()
+            except core.CancelledError as er:
+                if core.cur_task in self._woken:
+                    # Cancelled while pending on resume, pass the notification on
+                    self._woken.remove(core.cur_task)
+                    self._notify(1)
+                raise er
+            self._woken.remove(core.cur_task)
+        finally:
+            # Acquire the lock again, holding on to a cancellation until then.
+            cancelled = None
+            while True:
+                try:
+                    await self._lock.acquire()
+                    break
+                except core.CancelledError as er:
+                    cancelled = er
+            if cancelled is not None:
+                raise cancelled
+        return True
+
+    async def wait_for(self, predicate):
+        """Wait until calling *predicate* returns a true value, and return that
+        value.  The predicate is checked with the lock held, first straight away
+        and then each time the task is notified.
+        """
+
+        result = predicate()
+        while not result:
+            await self.wait()
+            result = predicate()
+        return result
+
+    def _notify(self, n):
+        while n > 0 and self.waiting.peek():
+            task = self.waiting.pop()
+            self._woken.add(task)
+            core._task_queue.push(task)
+            n -= 1
+
+    def notify(self, n=1):
+        """Wake up to *n* of the tasks waiting on the condition, in the order
+        they started waiting.  The lock must be held.
+        """
+
+        if not self._lock.locked():
+            raise RuntimeError("cannot notify on un-acquired lock")
+        self._notify(n)
+
+    def notify_all(self):
+        """Wake all the tasks waiting on the condition.  The lock must be held."""
+
+        if not self._lock.locked():
+            raise RuntimeError("cannot notify on un-acquired lock")
+        self._notify(len(self.waiting))
@@ -120,6 +120,88 @@ def sleep(t):
     return sleep_ms(int(t * 1000))
 
 
+# CIRCUITPY-CHANGE: added
+def sleep_until(deadline, sgen=SingletonGenerator()):
+    """Sleep until *deadline*, a value of `adafruit_ticks.ticks_ms`.  If it has
+    already passed then only yield to other tasks.
+
+    Sleeping until deadlines that are a fixed interval apart, rather than for the
+    interval, stops time spent running the task from adding up.  See also
+    `asyncio.ticker.Ticker`.
+
+    Returns a coroutine.
+    """
+
+    assert sgen.state is None, "Check for a missing `await` in your code"
+    now = ticks()
+    sgen.state = deadline if ticks_diff(deadline, now) > 0 else now
+    return sgen
+
+
+# CIRCUITPY-CHANGE: added
+def should_yield():
+    """Return ``True`` if the current task has run for longer than the slice
+    budget (see `Loop.set_slice_budget`) and another task is ready to run, or IO
+    is ready.  Otherwise return ``False``, starting a new slice if the budget was
+    used up.
+
+    The clock is only read every so many calls, as many as take about a
+    millisecond, so this is cheap enough to call for every item of a long
+    computation::
+
+        for item in items:
+            process(item)
+            if asyncio.should_yield():
+                await asyncio.sleep(0)
+
+    This is cheaper than `maybe_yield` where awaiting is slow, as on CPython.
+    """
+
+    global _slice_start, _yield_task, _yield_start, _yield_read, _yield_stride, _yield_countdown
+    if cur_task is not _yield_task or _slice_start != _yield_start:
+        # A new slice: measure how long the calls take again, from one call.
+        _yield_task = cur_task
+        _yield_start = _slice_start
+        _yield_read = _slice_start
+        _yield_stride = 1
+        _yield_countdown = 1
+    _yield_countdown -= 1
+    if _yield_countdown > 0:
+        return False
+    now = ticks()
+    if ticks_diff(now, _yield_read) < 1 and _yield_stride < 1024:
+        # The calls since the last read took under a millisecond, read half as often.
+        _yield_stride *= 2
+    _yield_read = now
+    _yield_countdown = _yield_stride
+    if ticks_diff(now, _slice_start) < Loop._slice_budget:
+        return False
+    # Schedule tasks whose IO is ready, as the run loop would.
+    if _io_queue.map:
+        _io_queue.wait_io_event(0)
+    t = _task_queue.peek()
+    if t and ticks_diff(t.ph_key, now) <= 0:
+        return True
+    # Nothing else can run, so carry on with a new slice, at the same stride.
+    _slice_start = _yield_start = now
+    return False
+
+
+# CIRCUITPY-CHANGE: added
+# Use a SingletonGenerator that does not yield to return without allocating on the heap
+def maybe_yield(sgen=SingletonGenerator()):
+    """Yield to other tasks if `should_yield` returns ``True``, otherwise
+    return straight away.
+
+    Call this regularly in long computations, instead of ``sleep(0)``, to keep
+    other tasks and IO responsive without switching tasks needlessly.
+
+    Returns a coroutine.
+    """
+
+    return sleep_ms(0) if should_yield() else sgen
+
+
 # CIRCUITPY-CHANGE: see https://github.com/adafruit/Adafruit_CircuitPython_asyncio/pull/30
 ################################################################################
 # "Never schedule" object"
@@ -159,11 +241,13 @@ def _never(sgen=_NeverSingletonGenerator()):
 class IOQueue:
     def __init__(self):
         self.poller = select.poll()
-        self.map = {}  # maps id(stream) to [task_waiting_read, task_waiting_write, stream]
+        # CIRCUITPY-CHANGE: track tasks that also wait on _task_queue with a deadline
+        self.map = {}  # maps id(stream) to [task_waiting_read, task_waiting_write, stream, read_has_deadline, write_has_deadline]
 
-    def _enqueue(self, s, idx):
+    # CIRCUITPY-CHANGE: optional deadline
+    def _enqueue(self, s, idx, deadline=None):
         if id(s) not in self.map:
-            entry = [None, None, s]
+            entry = [None, None, s, False, False]
             entry[idx] = cur_task
             self.map[id(s)] = entry
             self.poller.register(s, select.POLLIN if idx == 0 else select.POLLOUT)
@@ -173,6 +257,12 @@ class IOQueue:
             assert sm[1 - idx] is not None
             sm[idx] = cur_task
             self.poller.modify(s, select.POLLIN | select.POLLOUT)
+            entry = sm
+        # CIRCUITPY-CHANGE: with a deadline, also put the task on _task_queue. Whichever
+        # of the IO event and the deadline comes first takes it off the other queue.
+        if deadline is not None:
+            _task_queue.push(cur_task, deadline)
+            entry[3 + idx] = True
         # Link task to this IOQueue so it can be removed if needed
         cur_task.data = self
 
@@ -180,15 +270,15 @@ class IOQueue:
         del self.map[id(s)]
         self.poller.unregister(s)
 
-    # CIRCUITPY-CHANGE: async
-    async def queue_read(self, s):
-        self._enqueue(s, 0)
+    # CIRCUITPY-CHANGE: async, optional deadline
+    async def queue_read(self, s, deadline=None):
+        self._enqueue(s, 0, deadline)
         # CIRCUITPY-CHANGE: do not reschedule
         await _never()
 
-    # CIRCUITPY-CHANGE: async
-    async def queue_write(self, s):
-        self._enqueue(s, 1)
+    # CIRCUITPY-CHANGE: async, optional deadline
+    async def queue_write(self, s, deadline=None):
+        self._enqueue(s, 1, deadline)
         # CIRCUITPY-CHANGE: do not reschedule
         await _never()
 
@@ -196,25 +286,53 @@ class IOQueue:
         while True:
             del_s = None
             for k in self.map:  # Iterate without allocating on the heap
-                q0, q1, s = self.map[k]
-                if q0 is task or q1 is task:
-                    del_s = s
+                # CIRCUITPY-CHANGE: index, the entry has more than 3 items
+                sm = self.map[k]
+                if sm[0] is task or sm[1] is task:
+                    del_s = sm[2]
+                    # CIRCUITPY-CHANGE: also take the task off _task_queue
+                    if sm[3 if sm[0] is task else 4]:
+                        _task_queue.remove(task)
                     break
             if del_s is not None:
-                self._dequeue(s)
+                self._dequeue(del_s)
             else:
                 break
 
+    # CIRCUITPY-CHANGE: added
+    # Called by the run loop when the deadline of a task expires before its IO event.
+    # The task is already off _task_queue, so only stop waiting for the IO event.
+    def expire(self, task):
+        for k in self.map:  # Iterate without allocating on the heap
+            sm = self.map[k]
+            if sm[0] is task or sm[1] is task:
+                idx = 0 if sm[0] is task else 1
+                sm[idx] = None
+                sm[3 + idx] = False
+                if sm[1 - idx] is None:
+                    self._dequeue(sm[2])
+                else:
+                    self.poller.modify(sm[2], select.POLLOUT if idx == 0 else select.POLLIN)
+                return
+
     def wait_io_event(self, dt):
         for s, ev in self.poller.ipoll(dt):
             sm = self.map[id(s)]
             # print('poll', s, sm, ev)
             if ev & ~select.POLLOUT and sm[0] is not None:
                 # POLLIN or error
+                # CIRCUITPY-CHANGE: take the task off _task_queue if it has a deadline
+                if sm[3]:
+                    _task_queue.remove(sm[0])
+                    sm[3] = False
                 _task_queue.push(sm[0])
                 sm[0] = None
             if ev & ~select.POLLIN and sm[1] is not None:
                 # POLLOUT or error
+                # CIRCUITPY-CHANGE: take the task off _task_queue if it has a deadline
+                if sm[4]:
+                    _task_queue.remove(sm[1])
+                    sm[4] = False
                 _task_queue.push(sm[1])
                 sm[1] = None
             if sm[0] is None and sm[1] is None:
@@ -234,10 +352,32 @@ def _promote_to_task(aw):
     return aw if isinstance(aw, Task) else create_task(aw)
 
 
+# CIRCUITPY-CHANGE: task priorities, see asyncio.priority
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+_priorities = {}  # maps each unfinished Task without PRIORITY_NORMAL to its priority
+
+# CIRCUITPY-CHANGE: earliest deadline first scheduling, see asyncio.edf
+_deadlines = {}  # maps each unfinished Task with a deadline to its deadline info
+_deadline_misses = [0]  # total number of deadlines missed
+
+# CIRCUITPY-CHANGE: instrumentation of the run loop, see asyncio.monitor
+_monitor = None
+
+# CIRCUITPY-CHANGE: registry of the unfinished tasks, for all_tasks(), or None
+# when task tracking is off (the default), see asyncio.debug.enable_task_tracking
+_tasks = None
+_task_counts = [0, 0]  # number of tasks created and finished while tracking
+
+
 # Create and schedule a new task from a coroutine
-def create_task(coro):
+# CIRCUITPY-CHANGE: priority
+def create_task(coro, priority=PRIORITY_NORMAL):
     # CIRCUITPY-CHANGE: doc
     """Create a new task from the given coroutine and schedule it to run.
+    The *priority* is one of `PRIORITY_LOW`, `PRIORITY_NORMAL` or
+    `PRIORITY_HIGH`, see `asyncio.priority`.
 
     Returns the corresponding `Task` object.
     """
@@ -245,6 +385,17 @@ def create_task(coro):
     if not hasattr(coro, "send"):
         raise TypeError("coroutine expected")
     t = Task(coro, globals())
+    # CIRCUITPY-CHANGE: priority
+    if priority != PRIORITY_NORMAL:
+        from .priority import _prioritise
+
+        _prioritise(t, priority)
+    # CIRCUITPY-CHANGE: registry and instrumentation
+    if _tasks is not None:
+        _tasks.add(t)
+        _task_counts[0] += 1
+    if _monitor:
+        _monitor.created(t)
     _task_queue.push(t)
     return t
 
@@ -254,10 +405,14 @@ def run_until_complete(main_task=None):
     # CIRCUITPY-CHANGE: doc
     """Run the given *main_task* until it completes."""
 
-    global cur_task
+    # CIRCUITPY-CHANGE: _slice_start
+    global cur_task, _slice_start
     excs_all = (CancelledError, Exception)  # To prevent heap allocation in loop
     excs_stop = (CancelledError, StopIteration)  # To prevent heap allocation in loop
     while True:
+        # CIRCUITPY-CHANGE: the step of the previous task is over
+        if _monitor:
+            _monitor.suspended()
         # Wait until the head of _task_queue is ready to run
         dt = 1
         while dt > 0:
@@ -265,7 +420,9 @@ def run_until_complete(main_task=None):
             t = _task_queue.peek()
             if t:
                 # A task waiting on _task_queue; "ph_key" is time to schedule task at
-                dt = max(0, ticks_diff(t.ph_key, ticks()))
+                # CIRCUITPY-CHANGE: which is also when the slice of the next task starts
+                _slice_start = ticks()
+                dt = max(0, ticks_diff(t.ph_key, _slice_start))
             elif not _io_queue.map:
                 # No tasks can be woken
                 cur_task = None
@@ -278,16 +435,29 @@ def run_until_complete(main_task=None):
                 # can get a view of what is happening and possibly abort.
                 dt = 3
             # print('(poll {})'.format(dt), len(_io_queue.map))
+            # CIRCUITPY-CHANGE: instrumentation
+            if _monitor:
+                _monitor.polled()
             _io_queue.wait_io_event(dt)
 
         # Get next task to run and continue it
         t = _task_queue.pop()
         cur_task = t
+        # CIRCUITPY-CHANGE: instrumentation
+        if _monitor:
+            _monitor.resumed(t)
         try:
             # Continue running the coroutine, it's responsible for rescheduling itself
             exc = t.data
             if not exc:
                 t.coro.send(None)
+            # CIRCUITPY-CHANGE: The task waits on a queue with a deadline (see
+            # IOQueue._enqueue) and the deadline passed first. Take it off that queue
+            # and raise TimeoutError in it.
+            elif hasattr(exc, "expire"):
+                exc.expire(t)
+                t.data = None
+                t.coro.throw(TimeoutError)
             else:
                 # If the task is finished and on the run queue and gets here, then it
                 # had an exception and was not await'ed on.  Throwing into it now will
@@ -309,6 +479,15 @@ def run_until_complete(main_task=None):
                     t.state = False
             if t.state:
                 # Task was running but is now finished.
+                # CIRCUITPY-CHANGE: forget its priority and deadline, and
+                # take it out of the registry
+                if _tasks is not None and t in _tasks:
+                    _tasks.remove(t)
+                    _task_counts[1] += 1
+                if _priorities:
+                    _priorities.pop(t, None)
+                if _deadlines:
+                    _deadlines.pop(t, None)
                 if t.state is True:
                     # "None" indicates that the task is complete and not await'ed on (yet).
                     t.state = False if awaited else None
@@ -373,6 +552,16 @@ async def _stopper():
 
 cur_task = None
 _stop_task = None
+# CIRCUITPY-CHANGE: ticks() when the current task was resumed, see maybe_yield()
+_slice_start = 0
+# CIRCUITPY-CHANGE: how often maybe_yield reads the clock: the task and slice start
+# that the stride was measured for, the ticks of the last read, the number of calls
+# between reads, and the calls left until the next read
+_yield_task = None
+_yield_start = 0
+_yield_read = 0
+_yield_stride = 1
+_yield_countdown = 1
 
 
 class Loop:
@@ -380,12 +569,15 @@ class Loop:
     """Class representing the event loop"""
 
     _exc_handler = None
+    # CIRCUITPY-CHANGE: added
+    _slice_budget = 20
 
-    def create_task(coro):
+    # CIRCUITPY-CHANGE: priority
+    def create_task(coro, priority=PRIORITY_NORMAL):
         # CIRCUITPY-CHANGE: doc
         """Create a task from the given *coro* and return the new `Task` object."""
 
-        return create_task(coro)
+        return create_task(coro, priority)
 
     def run_forever():
         # CIRCUITPY-CHANGE: doc
@@ -420,6 +612,62 @@ class Loop:
 
         pass
 
+    # CIRCUITPY-CHANGE: added
+    def set_slice_budget(ms):
+        """Set how long, in milliseconds, a task may run before `maybe_yield` lets
+        other tasks run.  The default is 20 ms.
+        """
+
+        Loop._slice_budget = ms
+
+    # CIRCUITPY-CHANGE: added
+    def get_slice_budget():
+        """Get the slice budget in milliseconds.  See `Loop.set_slice_budget`."""
+
+        return Loop._slice_budget
+
+    # CIRCUITPY-CHANGE: added
+    def slice_elapsed():
+        """Return the number of milliseconds since the current task was last
+        resumed by the event loop (or `maybe_yield` started a new slice).  This
+        reads the clock, so in a loop over many small items call `maybe_yield`
+        instead, which reads it less often.
+        """
+
+        return ticks_diff(ticks(), _slice_start)
+
+    # CIRCUITPY-CHANGE: added, see asyncio.debug
+    _debug = False
+    # Steps of tasks that take at least this many seconds are logged in debug mode
+    slow_callback_duration = 0.1
+
+    def set_debug(enabled):
+        """Turn debug mode on or off.  In debug mode, each step of a task that
+        takes at least ``Loop.slow_callback_duration`` seconds (0.1 by default)
+        is logged with the task and what it waits on.  See `asyncio.debug`.
+        """
+
+        from .debug import _set_debug
+
+        Loop._debug = bool(enabled)
+        _set_debug(enabled)
+
+    def get_debug():
+        """Return whether debug mode is on."""
+
+        return Loop._debug
+
+    # CIRCUITPY-CHANGE: added
+    def every(interval, coro_fn):
+        """Create a task that calls ``await coro_fn(ticker)`` every *interval*
+        seconds, where *ticker* is the `asyncio.ticker.Ticker` that tracks late and
+        skipped ticks.  Return the new `Task` object; cancel it to stop.
+        """
+
+        from .ticker import _every
+
+        return create_task(_every(interval, coro_fn))
+
     def set_exception_handler(handler):
         # CIRCUITPY-CHANGE: doc
         """Set the exception handler to call when a Task raises an exception that is not
@@ -483,6 +731,32 @@ def current_task():
     return cur_task
 
 
+# CIRCUITPY-CHANGE: added
+def all_tasks():
+    """Return a set of the `Task` objects, created with `create_task` since
+    task tracking was turned on with `asyncio.debug.enable_task_tracking`, that
+    have not finished yet.  See also `asyncio.debug.dump_tasks`.
+
+    Raises ``RuntimeError`` if task tracking is off, or if tasks can't be listed
+    because there is no ``weakref`` module.
+    """
+
+    if _tasks is None:
+        raise RuntimeError("task tracking is off")
+    return {t for t in _tasks if t.state}
+
+
+# CIRCUITPY-CHANGE: added
+def task_counts():
+    """Return a tuple of the number of tasks created with `create_task`, and
+    of those that have finished, since task tracking was turned on or the event
+    loop was created, whichever is later.  A difference that keeps growing points
+    to tasks that never finish.  Both are 0 while task tracking is off.
+    """
+
+    return _task_counts[0], _task_counts[1]
+
+
 def new_event_loop():
     # CIRCUITPY-CHANGE: doc
     """Reset the event loop and return it.
@@ -499,6 +773,14 @@ def new_event_loop():
     _io_queue = IOQueue()
     # CIRCUITPY-CHANGE: exception info
     cur_task = None
+    # CIRCUITPY-CHANGE: priorities and deadlines
+    _priorities.clear()
+    _deadlines.clear()
+    _deadline_misses[0] = 0
+    # CIRCUITPY-CHANGE: task registry
+    if _tasks is not None:
+        _tasks.clear()
+    _task_counts[0] = _task_counts[1] = 0
     _exc_context['exception'] = None
     _exc_context['future'] = None
     return Loop
@@ -0,0 +1,254 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Debug mode
+==========
+
+A task that runs for a long time without waiting holds up every other task.  In
+debug mode, turned on with ``Loop.set_debug(True)``, each step of a task (the run
+from when the event loop resumes it to when it next waits) that takes at least
+``Loop.slow_callback_duration`` seconds is logged with the task's coroutine, the
+coroutines it is in (on CPython) and what it waits on next::
+
+    Executing <Task main -> poll_sensors> awaiting <Task read> waiting for IO took 0.512 seconds
+
+The log only says which task stalled once its step is over.  On CPython,
+`start_watchdog` starts a thread that prints the stack of a step that is still
+running after ``Loop.slow_callback_duration`` seconds.
+
+`dump_tasks` prints what every unfinished task is doing, to find tasks that wait
+forever.  It needs task tracking, which is off by default so that creating tasks
+doesn't pay for it, and is turned on with `enable_task_tracking`.
+"""
+
+import sys
+
+from . import core, monitor
+from .monitor import _coro_name
+
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+
+def _task_name(t):
+    # Name task t by its coroutine and the coroutines that it awaits (when the
+    # coroutine has cr_await, as on CPython).
+    names = [_coro_name(t.coro)]
+    aw = getattr(t.coro, "cr_await", None)
+    while aw is not None and hasattr(aw, "__qualname__"):
+        names.append(aw.__qualname__)
+        aw = getattr(aw, "cr_await", None) or getattr(aw, "gi_yieldfrom", None)
+    return "<Task " + " -> ".join(names) + ">"
+
+
+def _describe(t):
+    # Describe task t by its name and the chain of tasks and other objects it waits
+    # on, following Task.data.
+    desc = _task_name(t)
+    data = t.data
+    depth = 0
+    while isinstance(data, core.Task) and depth < 16:
+        desc += " awaiting <Task " + _coro_name(data.coro) + ">"
+        data = data.data
+        depth += 1
+    if data is core._io_queue:
+        desc += " waiting for IO"
+    elif data is not None and not isinstance(data, (core.Task, BaseException)):
+        desc += " waiting on " + getattr(data, "reason", type(data).__name__)
+    return desc
+
+
+def _io_state(t, io_queue):
+    io_map = io_queue.map
+    for k in io_map:  # Iterate without allocating on the heap
+        sm = io_map[k]
+        if sm[0] is t:
+            return "waiting to read " + repr(sm[2])
+        if sm[1] is t:
+            return "waiting to write " + repr(sm[2])
+    return "waiting for IO"
+
+
+def _state(t, now):
+    # Say what task t is doing, by interpreting Task.data and Task.state.
+    data = t.data
+    if not t.state:
+        state = "finished"
+    elif t is core.cur_task:
+        state = "running"
+    elif data is None:
+        ms = core.ticks_diff(t.ph_key, now)
+        state = f"sleeping for {ms} ms, until {t.ph_key}" if ms > 0 else "ready to run"
+    elif data is core.CancelledError or isinstance(data, BaseException):
+        state = "ready to run, cancelled"
+    elif data is core._io_queue:
+        state = _io_state(t, data)
+    elif isinstance(data, core.Task):
+        state = "awaiting " + _task_name(data)
+    elif getattr(data, "reason", None) is None:
+        state = "waiting for tasks"
+    else:
+        state = "waiting on " + data.reason
+        timed = getattr(data, "_timed", None)
+        if timed and t in timed:
+            state += f", timeout in {core.ticks_diff(t.ph_key, now)} ms"
+    return state
+
+
+class _TaskIds:
+    # Stands in for a WeakSet where there is no weakref.  Only the ids of the
+    # tasks are kept, so tasks are counted without being kept alive, but they
+    # can't be listed.
+    def __init__(self):
+        self.ids = set()
+
+    def add(self, t):
+        self.ids.add(id(t))
+
+    def remove(self, t):
+        self.ids.remove(id(t))
+
+    def __contains__(self, t):
+        return id(t) in self.ids
+
+    def __iter__(self):
+        raise RuntimeError("tasks can't be listed without weakref")
+
+    def clear(self):
+        self.ids.clear()
+
+
+def enable_task_tracking():
+    """Start keeping track of the tasks created with `create_task`, for
+    `all_tasks`, `task_counts` and `dump_tasks`.  Only tasks created from then on
+    are tracked.  Tasks are held by weak references, so tracking doesn't keep them
+    alive.  Where there is no ``weakref`` module the tasks are only counted.
+    """
+
+    if core._tasks is None:
+        try:
+            from weakref import WeakSet
+
+            core._tasks = WeakSet()
+        except ImportError:
+            core._tasks = _TaskIds()
+        core._task_counts[0] = core._task_counts[1] = 0
+
+
+def disable_task_tracking():
+    """Stop keeping track of tasks, and forget those tracked so far."""
+
+    core._tasks = None
+    core._task_counts[0] = core._task_counts[1] = 0
+
+
+def dump_tasks(file=None):
+    """Print each unfinished task (see `all_tasks`) and what it is doing: running,
+    ready to run, sleeping, or waiting on a stream, a lock, an event, another
+    task..., then the numbers of tasks created and finished (see
+    `task_counts`).  Prints to *file* if given, otherwise to the console.
+    Needs task tracking, see `enable_task_tracking`.
+    """
+
+    if file is None:
+        file = sys.stdout
+    now = core.ticks()
+    for t in core.all_tasks():
+        print(_task_name(t) + ":", _state(t, now), file=file)
+    created, finished = core.task_counts()
+    print(f"{created} tasks created, {finished} finished", file=file)
+
+
+class _SlowSteps(monitor.Monitor):
+    def __init__(self):
+        # Task being run, when its step started, and whether the watchdog has
+        # already reported the step
+        self.running = None
+        self.step_start = 0
+        self.reported = False
+
+    def resumed(self, t):
+        self.running = t
+        self.step_start = core.ticks()
+        self.reported = False
+
+    def suspended(self):
+        t = self.running
+        if t is None:
+            return
+        self.running = None
+        ms = core.ticks_diff(core.ticks(), self.step_start)
+        if ms >= core.Loop.slow_callback_duration * 1000:
+            print("Executing", _describe(t), f"took {ms / 1000:.3f} seconds")
+
+
+# The installed _SlowSteps, or None
+_slow_steps = None
+
+# Flag of the running watchdog thread, a list so the thread sees it cleared
+_watchdog = None
+
+
+def _set_debug(enabled):
+    global _slow_steps
+    if enabled and _slow_steps is None:
+        _slow_steps = _SlowSteps()
+        monitor.add(_slow_steps)
+    elif not enabled and _slow_steps is not None:
+        monitor.remove(_slow_steps)
+        _slow_steps = None
+
+
+def _watch(running, ident, interval):
+    import time
+    import traceback
+
+    while running[0]:
+        time.sleep(interval or core.Loop.slow_callback_duration / 2)
+        s = _slow_steps
+        t = s and s.running
+        if not t or s.reported:
+            continue
+        ms = core.ticks_diff(core.ticks(), s.step_start)
+        if ms < core.Loop.slow_callback_duration * 1000:
+            continue
+        s.reported = True
+        frame = sys._current_frames().get(ident)
+        print(_describe(t), f"has been running for {ms / 1000:.3f} seconds, at:")
+        if frame is not None:
+            traceback.print_stack(frame, file=sys.stdout)
+
+
+def start_watchdog(interval=None):
+    """Start a thread that checks every *interval* seconds (by default half of
+    ``Loop.slow_callback_duration``) whether a task step has been running for
+    longer than ``Loop.slow_callback_duration``, and if so prints the task and the
+    stack of the event loop, which must run in the calling thread.  Also turns
+    on debug mode.
+
+    This needs threads and ``sys._current_frames()``, so is only available on
+    CPython.  Raises `RuntimeError` otherwise.
+    """
+
+    global _watchdog
+    if _thread is None or not hasattr(sys, "_current_frames"):
+        raise RuntimeError("watchdog not supported")
+    stop_watchdog()
+    core.Loop.set_debug(True)
+    _watchdog = [True]
+    _thread.start_new_thread(_watch, (_watchdog, _thread.get_ident(), interval))
+
+
+def stop_watchdog():
+    """Stop the thread started by `start_watchdog`."""
+
+    global _watchdog
+    if _watchdog is not None:
+        _watchdog[0] = False
+        _watchdog = None
@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Earliest deadline first scheduling
+==================================
+
+A task can be given a deadline in milliseconds with `set_deadline`.  Each time
+the task becomes ready to run, it should then finish its step (run until it next
+waits) within that time.  Of the tasks that are ready, the event loop runs the
+one whose deadline is earliest first.  Tasks without a deadline run, in the
+order they became ready, when no task with a deadline is ready.
+
+`sleep_ms_deadline` gives a deadline to only the step that follows a sleep, for
+periodic tasks with a deadline per iteration.  A step that finishes after its
+deadline counts as a miss, see `deadline_misses`.
+
+The first use of a deadline switches the event loop to earliest deadline first
+scheduling, which can't be combined with task priorities (see
+`asyncio.priority`).
+"""
+
+from . import core
+
+
+def _before(a, b):
+    # Whether the ready entry a runs before b: earliest deadline first, then the
+    # entries without a deadline, in the order they became ready.
+    if a[0] is None:
+        return b[0] is None and a[1] < b[1]
+    if b[0] is None:
+        return True
+    d = core.ticks_diff(a[0], b[0])
+    return d < 0 or (d == 0 and a[1] < b[1])
+
+
+def _heappush(heap, entry):
+    heap.append(entry)
+    i = len(heap) - 1
+    while i:
+        parent = (i - 1) >> 1
+        if not _before(entry, heap[parent]):
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = entry
+
+
+def _heappop(heap):
+    last = heap.pop()
+    if not heap:
+        return last
+    entry = heap[0]
+    n = len(heap)
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and _before(heap[child + 1], heap[child]):
+            child += 1
+        if not _before(heap[child], last):
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = last
+    return entry
+
+
+class _EDFQueue:
+    # Stands in for core._task_queue in earliest deadline first mode, with the
+    # interface of TaskQueue.  Tasks are pushed on a TaskQueue of timers as usual,
+    # which sets their ph_key, and moved to a heap ordered by deadline once they are
+    # ready to run.
+
+    def __init__(self, queue):
+        self.timers = queue
+        # Heap of [deadline or None, sequence number, task] of the ready tasks
+        self.ready = []
+        # Maps each task in ready to its entry
+        self.entries = {}
+        self.seq = 0
+        # Entry of the task that last ran, if it had a deadline
+        self.running = None
+
+    def push(self, v, key=None):
+        self.timers.push(v, key)
+
+    def remove(self, v):
+        entry = self.entries.pop(v, None)
+        if entry is None:
+            self.timers.remove(v)
+        else:
+            # Skipped when it gets to the top of the heap.
+            entry[2] = None
+
+    def _collect(self):
+        # Move the tasks that are ready to run from timers to ready.
+        now = core.ticks()
+        timers = self.timers
+        ready = self.ready
+        t = timers.peek()
+        while t and core.ticks_diff(t.ph_key, now) <= 0:
+            timers.pop()
+            deadline = None
+            info = core._deadlines.get(t)
+            if info is not None:
+                if info[2] is not None:
+                    deadline = core.ticks_add(t.ph_key, info[2])
+                    info[2] = None
+                elif info[0] is not None:
+                    deadline = core.ticks_add(t.ph_key, info[0])
+            if not ready:
+                self.seq = 0
+            entry = [deadline, self.seq, t]
+            self.seq += 1
+            self.entries[t] = entry
+            _heappush(ready, entry)
+            t = timers.peek()
+        while ready and ready[0][2] is None:
+            _heappop(ready)
+
+    def peek(self):
+        self._collect()
+        if self.ready:
+            return self.ready[0][2]
+        return self.timers.peek()
+
+    def pop(self):
+        # The step of the task that last ran is over, check its deadline.  Not
+        # in peek(), which can also be called during a step (see should_yield).
+        running = self.running
+        if running is not None:
+            self.running = None
+            if core.ticks_diff(core._slice_start, running[0]) > 0:
+                core._deadline_misses[0] += 1
+                info = core._deadlines.get(running[2])
+                if info is not None:
+                    info[1] += 1
+        self._collect()
+        if not self.ready:
+            return self.timers.pop()
+        entry = _heappop(self.ready)
+        del self.entries[entry[2]]
+        if entry[0] is not None:
+            self.running = entry
+        return entry[2]
+
+
+def _info(task):
+    # Return the [relative deadline, misses, deadline of the next step only] of a
+    # task, switching to earliest deadline first scheduling if needed.
+    if not isinstance(core._task_queue, _EDFQueue):
+        if not isinstance(core._task_queue, core.TaskQueue):
+            raise RuntimeError("deadlines can't be used with task priorities")
+        core._task_queue = _EDFQueue(core._task_queue)
+    info = core._deadlines.get(task)
+    if info is None:
+        info = core._deadlines[task] = [None, 0, None]
+    return info
+
+
+def set_deadline(ms, task=None):
+    """Give *task*, or the current task if ``None``, a deadline of *ms*
+    milliseconds for each step, counted from when it becomes ready to run.  If
+    *ms* is ``None`` then the task no longer has a deadline.
+    """
+
+    _info(task or core.cur_task)[0] = ms
+
+
+def sleep_ms_deadline(t, deadline):
+    """Sleep for *t* milliseconds, like `sleep_ms`, and give the step that
+    follows a deadline of *deadline* milliseconds from the end of the sleep.
+
+    Returns a coroutine.
+    """
+
+    _info(core.cur_task)[2] = deadline
+    return core.sleep_ms(t)
+
+
+def deadline_misses(task=None):
+    """Return the number of steps of *task* that finished after their deadline,
+    or the total for all tasks if *task* is ``None``, since the event loop was
+    created.  The count of a task is forgotten once it finishes.
+
+    A step is checked against its deadline when the event loop next takes a task
+    to run, so if the loop then had nothing to run the wait counts too.
+    """
+
+    if task is None:
+        return core._deadline_misses[0]
+    info = core._deadlines.get(task)
+    return 0 if info is None else info[1]
@@ -15,6 +15,9 @@
 
 from . import core
 
+# CIRCUITPY-CHANGE: first in, first out queue of waiting tasks
+from .waitqueue import WaitQueue
+
 
 # Event class for primitive events that can be waited on, set, and cleared
 class Event:
@@ -25,7 +28,8 @@ class Event:
 
     def __init__(self):
         self.state = False  # False=unset; True=set
-        self.waiting = core.TaskQueue()  # Queue of Tasks waiting on completion of this event
+        # CIRCUITPY-CHANGE: WaitQueue rather than TaskQueue
+        self.waiting = WaitQueue("event")  # Queue of Tasks waiting on completion of this event
 
     def is_set(self):
         # CIRCUITPY-CHANGE: doc
@@ -41,8 +45,8 @@ class Event:
         # Event becomes set, schedule any tasks waiting on it
         # Note: This must not be called from anything except the thread running
         # the asyncio loop (i.e. neither hard or soft IRQ, or a different thread).
-        while self.waiting.peek():
-            core._task_queue.push(self.waiting.pop())
+        # CIRCUITPY-CHANGE: schedule them all, emptying the WaitQueue in a single pass
+        self.waiting.wake_all()
         self.state = True
 
     def clear(self):
@@ -51,20 +55,31 @@ class Event:
 
         self.state = False
 
-    # CIRCUITPY-CHANGE: async
-    async def wait(self):
+    # CIRCUITPY-CHANGE: async, timeout
+    async def wait(self, timeout=None):
         # CIRCUITPY-CHANGE: doc
         """Wait for the event to be set. If the event is already set then it returns
         immediately.
+
+        Returns ``True`` once the event is set.  If *timeout* is given then waiting
+        ends after *timeout* seconds even if the event is not set, and ``False`` is
+        returned.
         """
 
         if not self.state:
             # Event not set, put the calling task on the event's waiting queue
-            self.waiting.push(core.cur_task)
+            # CIRCUITPY-CHANGE: and on _task_queue at the deadline, if there is one
+            if timeout is None:
+                self.waiting.push(core.cur_task)
+            else:
+                self.waiting.push(core.cur_task, core.ticks_add(core.ticks(), int(timeout * 1000)))
             # Set calling task's data to the event's queue so it can be removed if needed
             core.cur_task.data = self.waiting
-             # CIRCUITPY-CHANGE: use await; never reschedule
-            await core._never()
+            # CIRCUITPY-CHANGE: use await; never reschedule
+            try:
+                await core._never()
+            except core.TimeoutError:
+                return False
         return True
 
 
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Aggregating exception handler
+=============================
+
+The default exception handler prints the traceback of every task that fails
+with an exception nobody retrieves.  When many tasks fail at once, say because a
+server they all talk to went away, printing hundreds of tracebacks to a serial
+console can stall the event loop for seconds.  `ExceptionAggregator` is an
+exception handler that prints fewer of them::
+
+    asyncio.get_running_loop().set_exception_handler(asyncio.ExceptionAggregator())
+
+* Exceptions are grouped by type and by the line that raised them.  Only the
+  first of each group is printed in full; the others are just counted.
+* At most *burst* tracebacks are printed every *period* seconds.
+* When exceptions weren't printed, a summary with a line per group is printed
+  once the *period* is over.
+
+Grouping an exception only reads its traceback; the exceptions that are not
+printed are never formatted.
+"""
+
+import sys
+
+from . import core
+
+
+def _site(exc):
+    # Return the key of the group of exception exc: its type and the code and
+    # line number of the innermost frame of its traceback.
+    tb = getattr(exc, "__traceback__", None)
+    if tb is None:
+        return (type(exc), None, 0)
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return (type(exc), tb.tb_frame.f_code, tb.tb_lineno)
+
+
+def _site_name(key):
+    exc_type, code, line = key
+    if code is None:
+        return exc_type.__name__
+    return f"{exc_type.__name__} at {code.co_filename}:{line} in {code.co_name}"
+
+
+class ExceptionAggregator:
+    """An exception handler, for `Loop.set_exception_handler`, that groups
+    identical exceptions and limits how many tracebacks are printed.
+
+    :param int burst: The number of tracebacks printed at most every *period*.
+    :param float period: The length in seconds of the periods that tracebacks
+        are counted over, and how often the summary of exceptions not printed is
+        printed.
+    :param int limit: The number of frames of each traceback to print, or
+        ``None`` to print them all.
+    :param file: Where to print, ``sys.stderr`` by default.
+    """
+
+    def __init__(self, burst=5, period=10, limit=None, file=None):
+        self.burst = burst
+        self.limit = limit
+        self.file = file
+        self._period = int(period * 1000)
+        # Start of the current period, and the tracebacks printed in it
+        self._start = None
+        self._printed = 0
+        # Maps the key of each group of exceptions to how many there were
+        # since the last summary
+        self._counts = {}
+        self._hidden = 0
+        # Task that prints the summary at the end of the period
+        self._summary = None
+
+    def __call__(self, loop, context):
+        exc = context["exception"]
+        now = core.ticks()
+        if self._start is None or core.ticks_diff(now, self._start) >= self._period:
+            self.flush()
+            self._start = now
+            self._printed = 0
+            self._summary = None
+        key = _site(exc)
+        n = self._counts.get(key, 0)
+        self._counts[key] = n + 1
+        if n == 0 and self._printed < self.burst:
+            self._printed += 1
+            core.print_exception(
+                None, exc, exc.__traceback__, limit=self.limit, file=self.file or sys.stderr
+            )
+            return
+        self._hidden += 1
+        if self._summary is None:
+            self._summary = core.create_task(self._summarise(self._start))
+
+    async def _summarise(self, start):
+        await core.sleep_ms(
+            max(0, core.ticks_diff(core.ticks_add(start, self._period), core.ticks()))
+        )
+        if self._start == start:
+            self.flush()
+
+    def flush(self):
+        """Print the summary of the exceptions not printed since the last
+        summary, if there were any, and start counting again.  The summary is
+        printed by a task, so call this after the event loop has stopped to see
+        the last one.
+        """
+
+        counts = self._counts
+        hidden = self._hidden
+        self._counts = {}
+        self._hidden = 0
+        if not hidden:
+            return
+        file = self.file or sys.stderr
+        print(f"{hidden} task exceptions not shown; since the last summary there were:", file=file)
+        for key, n in sorted(counts.items(), key=lambda item: -item[1]):
+            print(f"  {n} x {_site_name(key)}", file=file)
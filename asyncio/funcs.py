@@ -15,63 +15,137 @@
 
 from . import core
 
+# CIRCUITPY-CHANGE: added, for map_concurrent
+from .waitqueue import WaitQueue
 
-async def _run(waiter, aw):
-    try:
-        result = await aw
-        status = True
-    except BaseException as er:
-        result = None
-        status = er
-    if waiter.data is None:
-        # The waiter is still waiting, cancel it.
-        if waiter.cancel():
-            # Waiter was cancelled by us, change its CancelledError to an instance of
-            # CancelledError that contains the status and result of waiting on aw.
-            # If the wait_for task subsequently gets cancelled externally then this
-            # instance will be reset to a CancelledError instance without arguments.
-            waiter.data = core.CancelledError(status, result)
-
-async def wait_for(aw, timeout, sleep=core.sleep):
-    # CIRCUITPY-CHANGE: doc
-    """Wait for the *aw* awaitable to complete, but cancel if it takes longer
-    than *timeout* seconds. If *aw* is not a task then a task will be created
-    from it.
 
-    If a timeout occurs, it cancels the task and raises ``asyncio.TimeoutError``:
-    this should be trapped by the caller.
+# CIRCUITPY-CHANGE: added, to match CPython
+# Stands in for the coroutine of the timer Task that a Timeout puts on _task_queue.
+# When the deadline is reached the run loop "resumes" it, which cancels the task
+# that is inside the timeout block.
+class _Expire:
+    def __init__(self, timeout):
+        self.timeout = timeout
+
+    def send(self, value):
+        timeout = self.timeout
+        timeout._timer = None
+        timeout._expired = True
+        timeout._task.cancel()
+        raise StopIteration
+
+    def throw(self, *args):
+        raise StopIteration
+
+
+# CIRCUITPY-CHANGE: added, to match CPython
+class Timeout:
+    """An asynchronous context manager that cancels the current task if it has not
+    left the ``async with`` block by a given deadline, and then raises
+    ``asyncio.TimeoutError``.
+
+    Use `timeout` or `timeout_at` rather than creating a Timeout directly.
+
+    The timeout costs a single timer entry on the scheduler's queue, which is
+    removed again on leaving the block; no extra coroutine is run.
+    """
+
+    def __init__(self, when):
+        self._when = when
+        self._task = None
+        self._timer = None
+        self._expired = False
+
+    def when(self):
+        """Return the current deadline, in ticks (see ``adafruit_ticks.ticks_ms``),
+        or ``None`` if there is no deadline.
+        """
+
+        return self._when
+
+    def reschedule(self, when):
+        """Change the deadline to *when*, in ticks, or remove it if *when* is
+        ``None``.
+        """
+
+        self._disarm()
+        self._when = when
+        if self._task is not None:
+            self._arm()
 
-    Returns the return value of *aw*.
+    def expired(self):
+        """Return ``True`` if the deadline was reached before the block was left."""
+
+        return self._expired
+
+    def _arm(self):
+        if self._when is not None:
+            # The native Task takes core's globals as the asyncio context.
+            self._timer = core.Task(_Expire(self), core.__dict__)
+            core._task_queue.push(self._timer, self._when)
+
+    def _disarm(self):
+        if self._timer is not None:
+            core._task_queue.remove(self._timer)
+            self._timer = None
+
+    async def __aenter__(self):
+        if self._task is not None:
+            raise RuntimeError("Timeout already entered")
+        self._task = core.cur_task
+        self._arm()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._disarm()
+        self._task = None
+        if self._expired and exc_type is core.CancelledError:
+            # The cancellation came from this timeout, turn it into a TimeoutError.
+            raise core.TimeoutError
+
+
+# CIRCUITPY-CHANGE: added, to match CPython
+def timeout(delay):
+    """Return a `Timeout` context manager that raises ``asyncio.TimeoutError`` if
+    the ``async with`` block takes longer than *delay* seconds.  If *delay* is
+    ``None`` then no time limit is applied.
+    """
+
+    return Timeout(None if delay is None else core.ticks_add(core.ticks(), int(delay * 1000)))
+
+
+# CIRCUITPY-CHANGE: added, to match CPython
+def timeout_at(when):
+    """Return a `Timeout` context manager that raises ``asyncio.TimeoutError`` if
+    the ``async with`` block has not finished at the absolute time *when*, in
+    ticks (see ``adafruit_ticks.ticks_ms``).  If *when* is ``None`` then no time
+    limit is applied.
     """
 
-    aw = core._promote_to_task(aw)
+    return Timeout(when)
+
+
+# CIRCUITPY-CHANGE: built on Timeout, rather than on a runner task and a sleep
+async def _wait_for_ms(aw, timeout):
     if timeout is None:
         return await aw
+    async with Timeout(core.ticks_add(core.ticks(), timeout)):
+        return await aw
 
-    # Run aw in a separate runner task that manages its exceptions.
-    runner_task = core.create_task(_run(core.cur_task, aw))
 
-    try:
-        # Wait for the timeout to elapse.
-        await sleep(timeout)
-    except core.CancelledError as er:
-        # CIRCUITPY-CHANGE: more general fetching of exception arg
-        status = er.args[0] if er.args else None
-        if status is None:
-            # This wait_for was cancelled externally, so cancel aw and re-raise.
-            runner_task.cancel()
-            raise er
-        elif status is True:
-            # aw completed successfully and cancelled the sleep, so return aw's result.
-            return er.args[1]
-        else:
-            # aw raised an exception, propagate it out to the caller.
-            raise status
+# CIRCUITPY-CHANGE: not async, see _wait_for_ms
+def wait_for(aw, timeout):
+    # CIRCUITPY-CHANGE: doc
+    """Wait for the *aw* awaitable to complete, but cancel if it takes longer
+    than *timeout* seconds.
+
+    If a timeout occurs, it cancels *aw* and raises ``asyncio.TimeoutError``:
+    this should be trapped by the caller.
 
-    # The sleep finished before aw, so cancel aw and raise TimeoutError.
-    runner_task.cancel()
-    await runner_task
-    raise core.TimeoutError
+    Returns a coroutine that returns the return value of *aw*.
+    """
+
+    return _wait_for_ms(aw, None if timeout is None else int(timeout * 1000))
 
 
 def wait_for_ms(aw, timeout):
@@ -83,7 +157,7 @@ def wait_for_ms(aw, timeout):
     Returns a coroutine.
     """
 
-    return wait_for(aw, timeout, core.sleep_ms)
+    return _wait_for_ms(aw, timeout)
 
 
 class _Remove:
@@ -92,12 +166,57 @@ class _Remove:
         pass
 
 
+# CIRCUITPY-CHANGE: added
+# Stands in for the coroutine of a Task that is put on the TaskQueue in Task.state of a
+# task that is being awaited. The Task is scheduled when the awaited task completes, and
+# then calls the completion callback.
+class _Notify:
+    def __init__(self, t, cb):
+        self.t = t
+        self.cb = cb
+
+    def send(self, value):
+        if self.cb is not None:
+            self.cb(self.t, self.t.data)
+        raise StopIteration
+
+    def throw(self, *args):
+        raise StopIteration
+
+
+# CIRCUITPY-CHANGE: added
+# Register cb(t, er) to be called when the running task t completes, alongside any other
+# callbacks or tasks awaiting t. Returns a token to pass to _remove_done_callback.
+# The callback goes on the TaskQueue in Task.state, the way an awaiting task does, so
+# t can still be awaited afterwards.
+def _add_done_callback(t, cb):
+    state = t.state
+    if not isinstance(state, core.TaskQueue):
+        queue = core.TaskQueue()
+        if callable(state):
+            # Keep the callback already registered the plain way.
+            queue.push(core.Task(_Notify(t, state), core.__dict__))
+        t.state = state = queue
+    n = _Notify(t, cb)
+    state.push(core.Task(n, core.__dict__))
+    return n
+
+
+# CIRCUITPY-CHANGE: added
+# Deregister a callback registered by _add_done_callback, if it has not been called yet.
+def _remove_done_callback(t, token):
+    # The stand-in Task stays on the queue, and does nothing when it runs.
+    token.cb = None
+
+
 # CIRCUITPY-CHANGE: async
 async def gather(*aws, return_exceptions=False):
     # CIRCUITPY-CHANGE: doc
     """Run all *aws* awaitables concurrently. Any *aws* that are not tasks
     are promoted to tasks.
 
+    The tasks may also be awaited elsewhere, or be part of another gather.
+
     Returns a list of return values of all *aws*
     """
     # CIRCUITPY-CHANGE: no awaitables, so nothing to gather
@@ -128,22 +247,20 @@ async def gather(*aws, return_exceptions=False):
     # The `state` variable counts the number of tasks to wait for, and can be negative
     # if the gather should not run at all (because a task already had an exception).
     ts = [core._promote_to_task(aw) for aw in aws]
+    # CIRCUITPY-CHANGE: tokens to deregister the callback
+    tokens = [None] * len(ts)
     state = 0
     for i in range(len(ts)):
-        if ts[i].state is True:
-            # Task is running, register the callback to call when the task is done.
-            ts[i].state = done
+        if ts[i].state:
+            # CIRCUITPY-CHANGE: Task is running, register the callback to call when the
+            # task is done, even if something else is waiting on the task.
+            tokens[i] = _add_done_callback(ts[i], done)
             state += 1
-        elif not ts[i].state:
-            # Task finished already.
-            if not isinstance(ts[i].data, StopIteration):
-                # Task finished by raising an exception.
-                if not return_exceptions:
-                    # Do not run this gather at all.
-                    state = -len(ts)
-        else:
-            # Task being waited on, gather not currently supported for this case.
-            raise RuntimeError("can't gather")
+        elif not isinstance(ts[i].data, StopIteration):
+            # Task finished by raising an exception.
+            if not return_exceptions:
+                # Do not run this gather at all.
+                state = -len(ts)
 
     # Set the state for execution of the gather.
     gather_task = core.cur_task
@@ -160,9 +277,12 @@ async def gather(*aws, return_exceptions=False):
 
     # Clean up tasks.
     for i in range(len(ts)):
-        if ts[i].state is done:
-            # Sub-task is still running, deregister the callback and cancel if needed.
-            ts[i].state = True
+        # CIRCUITPY-CHANGE: deregister the callback, it may be pending for a finished task
+        running = ts[i].state
+        if tokens[i] is not None:
+            _remove_done_callback(ts[i], tokens[i])
+        if running:
+            # Sub-task is still running, cancel if needed.
             if cancel_all:
                 ts[i].cancel()
         elif isinstance(ts[i].data, StopIteration):
@@ -183,3 +303,431 @@ async def gather(*aws, return_exceptions=False):
 
     # Return the list of return values of each sub-task.
     return ts
+
+
+# CIRCUITPY-CHANGE: added, to match CPython
+FIRST_COMPLETED = "FIRST_COMPLETED"
+FIRST_EXCEPTION = "FIRST_EXCEPTION"
+ALL_COMPLETED = "ALL_COMPLETED"
+
+
+# CIRCUITPY-CHANGE: added, for wait
+# Whether a task that finished with "er" raised an exception, as FIRST_EXCEPTION counts
+# them: being cancelled doesn't count.
+def _raised(er):
+    return not isinstance(er, (StopIteration, core.CancelledError)) and er is not core.CancelledError
+
+
+# CIRCUITPY-CHANGE: added, for wait and as_completed
+# Collects tasks in the order that they complete, using the same completion callbacks
+# as gather. Each completion is O(1) work. The collecting task parks itself with
+# its data pointing here, optionally with a deadline (see core.IOQueue._enqueue).
+class _Completions:
+    def __init__(self, aws, return_when, timeout):
+        self.tasks = [core._promote_to_task(aw) for aw in aws]
+        self.return_when = return_when
+        self.deadline = None if timeout is None else core.ticks_add(core.ticks(), int(timeout * 1000))
+        self.done = []  # Tasks in order of completion
+        self.pending = 0  # Number of tasks still running
+        self.failed = False  # Whether any task raised an exception
+        self.waiter = None  # Task parked until the tasks need attention
+        self.timed = False  # Whether the waiter is also on _task_queue
+        self.tokens = [None] * len(self.tasks)  # To deregister the callback
+        cb = self._done  # Bind once
+        for i, t in enumerate(self.tasks):
+            if t.state:
+                # Task is running, register the callback to call when the task is done.
+                self.tokens[i] = _add_done_callback(t, cb)
+                self.pending += 1
+            else:
+                # Task finished already.
+                self.done.append(t)
+                self.failed = self.failed or _raised(t.data)
+
+    def _done(self, t, er):
+        # Sub-task "t" has finished, with exception "er".
+        self.done.append(t)
+        self.pending -= 1
+        if _raised(er):
+            self.failed = True
+        if self.waiter is not None and self._satisfied():
+            w = self.waiter
+            self.waiter = None
+            if self.timed:
+                self.timed = False
+                core._task_queue.remove(w)
+            core._task_queue.push(w)
+
+    def _satisfied(self):
+        if self.return_when == FIRST_COMPLETED:
+            return bool(self.done)
+        if self.return_when == FIRST_EXCEPTION and self.failed:
+            return True
+        return not self.pending
+
+    async def _park(self):
+        waiter = core.cur_task
+        if self.deadline is not None:
+            core._task_queue.push(waiter, self.deadline)
+            self.timed = True
+        self.waiter = waiter
+        waiter.data = self
+        await core._never()
+
+    def remove(self, task):
+        # The waiter was cancelled.
+        self.waiter = None
+        if self.timed:
+            self.timed = False
+            core._task_queue.remove(task)
+
+    def expire(self, task):
+        # The deadline of the waiter passed, it is already off _task_queue.
+        self.waiter = None
+        self.timed = False
+
+    def _close(self):
+        # Deregister the callback, it may be pending for a task that has finished.
+        for i, t in enumerate(self.tasks):
+            if self.tokens[i] is not None:
+                _remove_done_callback(t, self.tokens[i])
+                self.tokens[i] = None
+
+    def __aiter__(self):
+        self.head = 0
+        return self
+
+    async def aclose(self):
+        # Stop iterating early: forget the tasks that have not finished yet, which
+        # keep running.
+        self._close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._close()
+
+    async def __anext__(self):
+        if self.head == len(self.done):
+            if not self.pending:
+                raise StopAsyncIteration
+            try:
+                await self._park()
+            except BaseException as er:
+                self._close()
+                raise er
+        t = self.done[self.head]
+        # Drop the reference, the caller now owns the task.
+        self.done[self.head] = None
+        self.head += 1
+        return t
+
+    def __iter__(self):
+        self.head = 0
+        self.count = 0
+        return self
+
+    def __next__(self):
+        if self.count == len(self.tasks):
+            raise StopIteration
+        self.count += 1
+        return self._result()
+
+    async def _result(self):
+        return await (await self.__anext__())
+
+
+# CIRCUITPY-CHANGE: added, to match CPython
+async def wait(aws, timeout=None, return_when=ALL_COMPLETED):
+    """Run the *aws* awaitables concurrently and wait until the condition given by
+    *return_when* is met, or until *timeout* seconds have passed.  Any *aws* that
+    are not tasks are promoted to tasks.  *return_when* is one of:
+
+    - ``asyncio.FIRST_COMPLETED``: when any task finishes;
+    - ``asyncio.FIRST_EXCEPTION``: when any task raises an exception other than
+      being cancelled, or when all tasks have finished;
+    - ``asyncio.ALL_COMPLETED``: when all tasks have finished.
+
+    Returns a pair of sets ``(done, pending)`` of tasks.  Tasks are not cancelled
+    on a timeout.
+    """
+
+    if return_when not in {FIRST_COMPLETED, FIRST_EXCEPTION, ALL_COMPLETED}:
+        raise ValueError("Invalid return_when value: " + str(return_when))
+    c = _Completions(aws, return_when, timeout)
+    if not c.tasks:
+        raise ValueError("empty set of awaitables")
+    try:
+        if not c._satisfied():
+            await c._park()
+    except core.TimeoutError:
+        pass
+    finally:
+        c._close()
+    done = set(c.done)
+    return done, set(t for t in c.tasks if t not in done)
+
+
+# CIRCUITPY-CHANGE: added, to match CPython
+def as_completed(aws, timeout=None):
+    """Run the *aws* awaitables concurrently and iterate over them in the order
+    that they finish.  Any *aws* that are not tasks are promoted to tasks.
+
+    With ``async for``, the finished tasks are given::
+
+        async for task in asyncio.as_completed(tasks):
+            result = await task
+
+    With ``for``, awaitables are given that return the next result::
+
+        for aw in asyncio.as_completed(tasks):
+            result = await aw
+
+    ``asyncio.TimeoutError`` is raised if the tasks have not all finished within
+    *timeout* seconds.
+
+    When stopping an ``async for`` early, use the iterator in an ``async with``
+    statement or call its ``aclose()`` method, as with `gather_iter`.
+    """
+
+    return _Completions(aws, FIRST_COMPLETED, timeout)
+
+
+# CIRCUITPY-CHANGE: added
+class _GatherIter(_Completions):
+    def __init__(self, aws, return_exceptions):
+        super().__init__(aws, FIRST_COMPLETED, None)
+        self.return_exceptions = return_exceptions
+        # Maps each task to its position in aws, or to a list of its positions if
+        # the same awaitable was given more than once.
+        self.index = index = {}
+        for i, t in enumerate(self.tasks):
+            j = index.get(t)
+            if j is None:
+                index[t] = i
+            elif isinstance(j, list):
+                j.append(i)
+            else:
+                index[t] = [j, i]
+
+    async def __anext__(self):
+        t = await super().__anext__()
+        i = self.index.pop(t)
+        if isinstance(i, list):
+            # The task completes once for each of its positions, in order.
+            positions = i
+            i = positions.pop(0)
+            if positions:
+                self.index[t] = positions
+        # Forget the task, so its result can be freed once the caller is done with it.
+        self.tasks[i] = None
+        self.tokens[i] = None
+        er = t.data
+        if isinstance(er, StopIteration):
+            return i, er.value
+        if self.return_exceptions:
+            return i, er
+        self._close()
+        raise er
+
+
+# CIRCUITPY-CHANGE: added
+def gather_iter(*aws, return_exceptions=False):
+    """Run all *aws* awaitables concurrently, like `gather`, but give each result as
+    soon as it is available rather than a list of all of them at the end.  Any *aws*
+    that are not tasks are promoted to tasks.
+
+    Use it in an ``async for`` statement, which gives ``(index, result)`` pairs in
+    the order that the awaitables finish, where *index* is the position of the
+    awaitable in *aws*::
+
+        async for i, result in asyncio.gather_iter(*requests):
+            process(i, result)
+
+    If an awaitable raises an exception then it is raised by the ``async for``
+    statement, unless *return_exceptions* is ``True`` in which case the exception
+    is given as the result.
+
+    Only the results that have not been given yet are kept, so results can be freed
+    as they are processed.
+
+    To stop before all the results are given, use the iterator in an ``async
+    with`` statement, or call its ``aclose()`` method, so that it stops tracking
+    the tasks that are still running::
+
+        async with asyncio.gather_iter(*requests) as results:
+            async for i, result in results:
+                if result is not None:
+                    break
+    """
+
+    return _GatherIter(aws, return_exceptions)
+
+
+# CIRCUITPY-CHANGE: added
+class _MapConcurrent:
+    def __init__(self, fn, iterable, limit, ordered):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.fn = fn
+        self.limit = limit
+        self.ordered = ordered
+        if hasattr(iterable, "__aiter__"):
+            from .lock import Lock
+
+            self.source = iterable.__aiter__()
+            # Only one worker at a time may wait on the async iterator.
+            self.pulling = Lock()
+        else:
+            self.source = iter(iterable)
+            self.pulling = None
+        self.workers = None  # Worker tasks, started on the first iteration
+        self.active = 0  # Number of workers still running
+        self.count = 0  # Number of items taken from the source
+        self.next = 0  # Index of the next result to give, when ordered
+        self.outstanding = 0  # Number of items taken but whose result was not given yet
+        self.results = {} if ordered else []
+        self.exhausted = False
+        self.error = None
+        self.slot = WaitQueue("queue")  # Workers waiting for outstanding to drop below limit
+        self.consumer = None  # Task waiting for a result
+
+    async def _pull(self):
+        # Return (index, item) of the next item from the source, or None at its end.
+        if self.pulling is None:
+            try:
+                item = next(self.source)
+            except StopIteration:
+                self.exhausted = True
+                return None
+        else:
+            async with self.pulling:
+                if self.exhausted:
+                    return None
+                try:
+                    item = await self.source.__anext__()
+                except StopAsyncIteration:
+                    self.exhausted = True
+                    return None
+        i = self.count
+        self.count += 1
+        return i, item
+
+    async def _work(self):
+        try:
+            while True:
+                while self.outstanding >= self.limit and not (self.exhausted or self.error):
+                    # Wait for the consumer to take a result.
+                    self.slot.push(core.cur_task)
+                    core.cur_task.data = self.slot
+                    await core._never()
+                if self.exhausted or self.error is not None:
+                    break
+                self.outstanding += 1
+                pulled = await self._pull()
+                if pulled is None:
+                    self.outstanding -= 1
+                    break
+                result = await self.fn(pulled[1])
+                if self.ordered:
+                    self.results[pulled[0]] = result
+                else:
+                    self.results.append(result)
+                self._wake_consumer()
+        except Exception as er:
+            if self.error is None:
+                self.error = er
+        finally:
+            self.active -= 1
+            self._wake_consumer()
+            # Pass on the end of the source or the error to a waiting worker.
+            self.slot.wake()
+
+    def _wake_consumer(self):
+        if self.consumer is not None:
+            core._task_queue.push(self.consumer)
+            self.consumer = None
+
+    def remove(self, task):
+        # The consumer was cancelled while waiting for a result.
+        self.consumer = None
+
+    def __aiter__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def __anext__(self):
+        if self.workers is None:
+            self.workers = [core.create_task(self._work()) for _ in range(self.limit)]
+            self.active = self.limit
+        while True:
+            if self.error is not None:
+                er = self.error
+                await self.aclose()
+                raise er
+            if self.ordered:
+                if self.next in self.results:
+                    result = self.results.pop(self.next)
+                    self.next += 1
+                    break
+            elif self.results:
+                result = self.results.pop(0)
+                break
+            if not self.active:
+                raise StopAsyncIteration
+            self.consumer = core.cur_task
+            core.cur_task.data = self
+            await core._never()
+        # Let a worker take the next item.
+        self.outstanding -= 1
+        self.slot.wake()
+        return result
+
+    async def aclose(self):
+        """Stop the workers, discarding any results that have not been given."""
+
+        if self.workers is not None:
+            for t in self.workers:
+                t.cancel()
+            self.workers = []
+        self.results = {} if self.ordered else []
+
+
+# CIRCUITPY-CHANGE: added
+def map_concurrent(fn, iterable, limit, ordered=False):
+    """Call the coroutine function *fn* on each item of *iterable* with at most
+    *limit* calls running at once, and give the results as they become available.
+    *iterable* can be an iterable or an asynchronous iterable, and is consumed
+    lazily as calls finish.
+
+    Use it in an ``async for`` statement::
+
+        async for reading in asyncio.map_concurrent(fetch, sensors, limit=4):
+            process(reading)
+
+    The calls are made by *limit* worker tasks, so no task is created per item and
+    memory use depends on *limit*, not on the number of items.  At most *limit*
+    results are held at a time: workers wait while the results are not taken.
+
+    If *ordered* is ``False``, results are given in the order that the calls
+    finish.  If ``True``, results are given in the order of the items.
+
+    If *fn* or *iterable* raises an exception, the workers are cancelled and the
+    exception is raised by the ``async for`` statement.  When stopping the
+    ``async for`` early, use the object returned by this function in an ``async
+    with`` statement, or call its ``aclose()`` method, so that the workers are
+    stopped rather than left waiting for their results to be taken::
+
+        async with asyncio.map_concurrent(fetch, sensors, limit=4) as readings:
+            async for reading in readings:
+                if reading is None:
+                    break
+    """
+
+    return _MapConcurrent(fn, iterable, limit, ordered)
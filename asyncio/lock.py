@@ -19,6 +19,9 @@ Locks
 
 from . import core
 
+# CIRCUITPY-CHANGE: first in, first out queue of waiting tasks
+from .waitqueue import WaitQueue
+
 
 # Lock class for primitive mutex capability
 class Lock:
@@ -37,7 +40,8 @@ class Lock:
         # - <Task>: unlocked but this task has been scheduled to acquire the lock next
         self.state = 0
         # Queue of Tasks waiting to acquire this Lock
-        self.waiting = core.TaskQueue()
+        # CIRCUITPY-CHANGE: WaitQueue rather than TaskQueue
+        self.waiting = WaitQueue("lock")
 
     def locked(self):
         # CIRCUITPY-CHANGE: doc
@@ -62,16 +66,24 @@ class Lock:
             # No Task waiting so unlock
             self.state = 0
 
-    # CIRCUITPY-CHANGE: async, since we don't use yield
-    async def acquire(self):
+    # CIRCUITPY-CHANGE: async, since we don't use yield; timeout
+    async def acquire(self, timeout=None):
         # CIRCUITPY-CHANGE: doc
         """Wait for the lock to be in the unlocked state and then lock it in an
         atomic way. Only one task can acquire the lock at any one time.
+
+        Returns ``True`` once the lock is acquired.  If *timeout* is given then
+        waiting ends after *timeout* seconds if the lock could not be acquired,
+        and ``False`` is returned.
         """
 
         if self.state != 0:
             # Lock unavailable, put the calling Task on the waiting queue
-            self.waiting.push(core.cur_task)
+            # CIRCUITPY-CHANGE: and on _task_queue at the deadline, if there is one
+            if timeout is None:
+                self.waiting.push(core.cur_task)
+            else:
+                self.waiting.push(core.cur_task, core.ticks_add(core.ticks(), int(timeout * 1000)))
             # Set calling task's data to the lock's queue so it can be removed if needed
             core.cur_task.data = self.waiting
             try:
@@ -83,6 +95,9 @@ class Lock:
                     self.state = 1
                     self.release()
                 raise er
+            # CIRCUITPY-CHANGE: the deadline passed first
+            except core.TimeoutError:
+                return False
         # Lock available, set it as locked
         self.state = 1
         return True
@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Scheduler metrics
+=================
+
+Optional instrumentation of the event loop, to see where the time goes.  After
+`enable_metrics` the event loop records:
+
+* for each task, how many times it was resumed, the total and longest time of
+  its steps (the run from one resume to the next time it waits), and how long it
+  spent waiting on IO, on timers (`sleep` and yielding) and on anything else
+  (events, locks, other tasks...);
+* for the loop, a histogram of the lag between when tasks were due to run (for
+  example the end of a sleep) and when they ran, and the number of task resumes
+  and of IO polls.
+
+Times are in milliseconds, read from the clock that the event loop reads
+anyway.  A step shorter than a millisecond counts as 0 or 1 ms, depending on
+whether the clock ticked during it, so the totals over many steps are about
+right but the time of a single short step is not.
+
+`metrics_snapshot` returns them as a dict.  When metrics are disabled (the
+default) the event loop only checks a global variable at a few points.
+"""
+
+from . import core, monitor
+
+LAG_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+"""Lower bounds, in milliseconds, of the buckets of the lag histogram."""
+
+# The installed _Metrics, or None
+_metrics = None
+
+# Indexes into the per-task lists
+_RESUMES = 0
+_STEP = 1
+_MAX_STEP = 2
+_WAIT_IO = 3
+_WAIT_TIMER = 4
+_WAIT_OTHER = 5
+_SUSPENDED_AT = 6
+_WAITING_ON = 7
+
+
+class _Metrics(monitor.Monitor):
+    # Times are taken from the clock the run loop reads anyway (core._slice_start),
+    # so recording them doesn't read it again.
+
+    def __init__(self):
+        self.start_ms = core.ticks()
+        self.resumes = 0
+        self.polls = 0
+        self.lag = [0] * len(LAG_BUCKETS)
+        # Maps each unfinished task that has run to a list of its metrics.  The
+        # list is also kept on the task, as Task._metrics, to find it without a
+        # lookup, except on the native Task which doesn't take attributes.
+        self.tasks = {}
+        # Task being run, the list of its metrics and when its step started
+        self.running = None
+        self.counters = None
+        self.step_start = 0
+
+    def _add(self, t):
+        # First resume of t since metrics were enabled.
+        m = self.tasks[t] = [0, 0, 0, 0, 0, 0, None, 0]
+        try:
+            t._metrics = m
+        except AttributeError:
+            pass
+        return m
+
+    def detach(self):
+        # Take the metrics off the tasks, so that they aren't found again.
+        for t in self.tasks:
+            try:
+                del t._metrics
+            except AttributeError:
+                pass
+
+    def resumed(self, t):
+        # The run loop read the time just before it took t off the run queue.
+        now = core._slice_start
+        self.resumes += 1
+        lag = core.ticks_diff(now, t.ph_key)
+        i = 0
+        while lag > 0 and i < len(LAG_BUCKETS) - 1:
+            lag >>= 1
+            i += 1
+        self.lag[i] += 1
+        m = getattr(t, "_metrics", None) or self.tasks.get(t) or self._add(t)
+        if m[_SUSPENDED_AT] is not None:
+            m[m[_WAITING_ON]] += core.ticks_diff(now, m[_SUSPENDED_AT])
+        m[_RESUMES] += 1
+        self.running = t
+        self.counters = m
+        self.step_start = now
+
+    def polled(self):
+        self.polls += 1
+        t = self.running
+        if t is None:
+            return
+        # The step of t is over.
+        self.running = None
+        if not t.state:
+            # Finished
+            self.tasks.pop(t, None)
+            return
+        # The run loop read the time since, unless there is no task to run.
+        now = core._slice_start if core._task_queue.peek() else core.ticks()
+        m = self.counters
+        step = core.ticks_diff(now, self.step_start)
+        m[_STEP] += step
+        m[_MAX_STEP] = max(m[_MAX_STEP], step)
+        m[_SUSPENDED_AT] = now
+        data = t.data
+        if data is None:
+            m[_WAITING_ON] = _WAIT_TIMER
+        elif data is core._io_queue:
+            m[_WAITING_ON] = _WAIT_IO
+        else:
+            m[_WAITING_ON] = _WAIT_OTHER
+
+
+def enable_metrics():
+    """Start recording metrics, discarding any recorded so far."""
+
+    global _metrics
+    if _metrics is not None:
+        monitor.remove(_metrics)
+        _metrics.detach()
+    _metrics = _Metrics()
+    monitor.add(_metrics)
+
+
+def disable_metrics():
+    """Stop recording metrics."""
+
+    global _metrics
+    if _metrics is not None:
+        monitor.remove(_metrics)
+        _metrics.detach()
+        _metrics = None
+
+
+def metrics_snapshot():
+    """Return the metrics recorded since `enable_metrics` as a dict with the keys:
+
+    * ``"elapsed_ms"``: milliseconds since metrics were enabled
+    * ``"resumes"``, ``"polls"``: number of task resumes and of IO polls
+    * ``"resumes_per_s"``, ``"polls_per_s"``: the same per second
+    * ``"lag"``: list of the number of resumes that were late by at least the
+      matching number of milliseconds in `LAG_BUCKETS`, but less than the next
+    * ``"tasks"``: dict mapping each unfinished `Task` to a dict with the keys
+      ``"resumes"``, ``"step_ms"``, ``"max_step_ms"``, ``"io_wait_ms"``,
+      ``"timer_wait_ms"`` and ``"other_wait_ms"``; times are in milliseconds
+
+    Returns ``None`` if metrics are not enabled.
+    """
+
+    m = _metrics
+    if m is None:
+        return None
+    elapsed = core.ticks_diff(core.ticks(), m.start_ms)
+    seconds = max(elapsed, 1) / 1000
+    tasks = {}
+    for t, tm in m.tasks.items():
+        tasks[t] = {
+            "resumes": tm[_RESUMES],
+            "step_ms": tm[_STEP],
+            "max_step_ms": tm[_MAX_STEP],
+            "io_wait_ms": tm[_WAIT_IO],
+            "timer_wait_ms": tm[_WAIT_TIMER],
+            "other_wait_ms": tm[_WAIT_OTHER],
+        }
+    return {
+        "elapsed_ms": elapsed,
+        "resumes": m.resumes,
+        "polls": m.polls,
+        "resumes_per_s": m.resumes / seconds,
+        "polls_per_s": m.polls / seconds,
+        "lag": list(m.lag),
+        "tasks": tasks,
+    }
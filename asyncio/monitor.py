@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Run loop monitors
+=================
+
+Instrumentation (`asyncio.metrics`, `asyncio.debug`...) is told about the steps
+of tasks by the run loop, which calls the methods of `Monitor` on
+``core._monitor``.  That is ``None`` when nothing is installed, so the run loop
+only checks a global variable.  When several monitors are installed,
+``core._monitor`` fans the calls out to each of them.
+"""
+
+from . import core
+
+try:
+    from time import monotonic_ns
+
+    def _us():
+        return monotonic_ns() // 1000
+
+except ImportError:
+    from time import monotonic
+
+    def _us():
+        return int(monotonic() * 1000000)
+
+
+def _coro_name(coro):
+    return getattr(coro, "__qualname__", None) or getattr(coro, "__name__", None) or repr(coro)
+
+
+class Monitor:
+    # Called by create_task() with the new task t.
+    def created(self, t):
+        pass
+
+    # Called by the run loop when it is about to resume task t.
+    def resumed(self, t):
+        pass
+
+    # Called by the run loop when the step of the task it last resumed is over.
+    def suspended(self):
+        pass
+
+    # Called by the run loop before it polls for IO.
+    def polled(self):
+        pass
+
+
+class _Monitors(Monitor):
+    def __init__(self, monitors):
+        self.monitors = monitors
+
+    def created(self, t):
+        for m in self.monitors:
+            m.created(t)
+
+    def resumed(self, t):
+        for m in self.monitors:
+            m.resumed(t)
+
+    def suspended(self):
+        for m in self.monitors:
+            m.suspended()
+
+    def polled(self):
+        for m in self.monitors:
+            m.polled()
+
+
+_installed = []
+
+
+def _update():
+    if not _installed:
+        core._monitor = None
+    elif len(_installed) == 1:
+        core._monitor = _installed[0]
+    else:
+        core._monitor = _Monitors(list(_installed))
+
+
+def add(monitor):
+    _installed.append(monitor)
+    _update()
+
+
+def remove(monitor):
+    if monitor in _installed:
+        _installed.remove(monitor)
+        _update()
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Connection pools
+================
+"""
+
+import select
+
+from . import core
+from .stream import open_connection
+from .waitqueue import WaitQueue
+
+
+class _Connection:
+    # Async context manager returned by ConnectionPool.connection().
+    def __init__(self, pool, key):
+        self.pool = pool
+        self.key = key
+        self.stream = None
+
+    async def __aenter__(self):
+        self.stream = await self.pool.acquire(*self.key)
+        return self.stream, self.stream
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # A connection that saw an exception may be in an unknown protocol state,
+        # so only hand it back for reuse if the block completed normally.
+        self.pool.release(self.stream, exc_type is None)
+
+
+class ConnectionPool:
+    """A pool of open TCP (and TLS) connections made with `open_connection`.
+    Released connections are kept open and handed out again for later requests
+    to the same server, which saves the connection and TLS handshake latency.
+
+    Connections are pooled by ``(host, port, ssl, server_hostname)``.  At most
+    *max_per_host* connections, idle or in use, are kept for each of these; any
+    further requests wait until a connection is released.  Idle connections
+    that have not been used for *idle_timeout* seconds are closed, for every
+    server, the next time a connection is acquired, or by `ConnectionPool.prune`.
+
+    Use `ConnectionPool.connection` in an ``async with`` statement to borrow a
+    connection::
+
+        pool = asyncio.ConnectionPool()
+        async with pool.connection("example.com", 80) as (reader, writer):
+            writer.write(b"GET / HTTP/1.1\\r\\nHost: example.com\\r\\n\\r\\n")
+            await writer.drain()
+            status = await reader.readline()
+    """
+
+    def __init__(self, max_per_host=4, idle_timeout=60):
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        # Maps a key to [list of idle (stream, ticks released), number in use, WaitQueue of waiting tasks]
+        self._hosts = {}
+        # Maps each stream that has been handed out to its key
+        self._in_use = {}
+        self._poller = select.poll()
+
+    def _alive(self, stream):
+        # An idle connection should have nothing to read: if it polls readable then
+        # the peer closed it, reset it or sent unexpected data, so it can't be reused.
+        self._poller.register(stream.s, select.POLLIN)
+        try:
+            for _ in self._poller.ipoll(0):
+                return False
+            return True
+        finally:
+            self._poller.unregister(stream.s)
+
+    def _wake(self, entry):
+        # Schedule the next task waiting for a connection, if any.
+        entry[2].wake()
+
+    async def acquire(self, host, port, ssl=None, server_hostname=None):
+        """Return a stream connected to *host* and *port*, reusing an idle
+        connection if there is one that is still alive.  The arguments are the
+        same as for `open_connection`.
+
+        The stream must be given back with `ConnectionPool.release` once it is no
+        longer needed.
+        """
+
+        await self.prune()
+        key = (host, port, ssl, server_hostname)
+        entry = self._hosts.get(key)
+        if entry is None:
+            entry = self._hosts[key] = [[], 0, WaitQueue("pool")]
+        idle = entry[0]
+        while True:
+            now = core.ticks()
+            while idle:
+                # Reuse the most recently released connection first.
+                stream, released = idle.pop()
+                expired = core.ticks_diff(now, released) >= self.idle_timeout * 1000
+                if not expired and self._alive(stream):
+                    entry[1] += 1
+                    self._in_use[stream] = key
+                    return stream
+                await stream.wait_closed()
+            if entry[1] < self.max_per_host:
+                break
+            # All connections for this key are in use, wait for one to be released.
+            entry[2].push(core.cur_task)
+            core.cur_task.data = entry[2]
+            try:
+                await core._never()
+            except core.CancelledError as er:
+                # Pass the wake-up on, in case it was meant for this task.
+                self._wake(entry)
+                raise er
+        entry[1] += 1
+        try:
+            stream, _ = await open_connection(host, port, ssl, server_hostname)
+        except BaseException as er:
+            entry[1] -= 1
+            self._wake(entry)
+            raise er
+        self._in_use[stream] = key
+        return stream
+
+    def release(self, stream, reuse=True):
+        """Give back a *stream* obtained from `ConnectionPool.acquire`.  If *reuse*
+        is ``False`` then the connection is closed rather than kept for reuse.
+        """
+
+        key = self._in_use.pop(stream)
+        entry = self._hosts[key]
+        entry[1] -= 1
+        if reuse:
+            entry[0].append((stream, core.ticks()))
+        else:
+            # Close through the stream, which keeps its TLS session for resumption.
+            core.create_task(stream.wait_closed())
+        self._wake(entry)
+
+    async def prune(self):
+        """Close the idle connections, to any server, that have not been used for
+        *idle_timeout* seconds.  This is done on each `ConnectionPool.acquire`,
+        so only needs calling to close them sooner.
+        """
+
+        now = core.ticks()
+        timeout = self.idle_timeout * 1000
+        expired = []
+        for entry in self._hosts.values():
+            idle = entry[0]
+            # Idle connections are in the order they were released.
+            n = 0
+            while n < len(idle) and core.ticks_diff(now, idle[n][1]) >= timeout:
+                n += 1
+            expired.extend(idle[:n])
+            del idle[:n]
+        for stream, _ in expired:
+            await stream.wait_closed()
+
+    def connection(self, host, port, ssl=None, server_hostname=None):
+        """Borrow a connection for the duration of an ``async with`` statement,
+        which gives a ``(reader, writer)`` pair like `open_connection`.  The
+        connection is returned to the pool on exit, or closed if the block raised
+        an exception.
+        """
+
+        return _Connection(self, (host, port, ssl, server_hostname))
+
+    async def close(self):
+        """Close all idle connections."""
+
+        for entry in self._hosts.values():
+            for stream, _ in entry[0]:
+                await stream.wait_closed()
+            entry[0].clear()
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Task priorities
+===============
+
+Tasks can be given a priority of `PRIORITY_LOW`, `PRIORITY_NORMAL` (the default)
+or `PRIORITY_HIGH` when they are created with ``create_task(coro, priority=...)``.
+Of the tasks that are ready to run, the event loop then runs those of higher
+priority first.  Priorities are only used between tasks that are ready, so they
+don't change when a sleeping task or one waiting for IO wakes up.
+
+The first time a task is given a priority other than `PRIORITY_NORMAL`, the run
+queue is replaced by one that keeps a queue per priority, so programs that don't
+use priorities don't pay for them.
+"""
+
+from . import core
+
+# Scheduling policy, see set_priority_policy()
+_weights = None
+_max_wait = None
+
+# Virtual time units given to a priority each time one of its tasks runs,
+# divided by the weight of the priority
+_STRIDE = 1 << 12
+
+
+class _ReadyQueues:
+    # Stands in for core._task_queue once a task has a priority, with the interface
+    # of TaskQueue.  There is a TaskQueue per priority, and peek() and pop() give the
+    # ready task (its ph_key has passed) that the policy picks, or if no task is
+    # ready then the task that is ready first.
+
+    def __init__(self, queue):
+        # Indexed by priority, with the existing queue as the PRIORITY_NORMAL one
+        self.queues = [core.TaskQueue(), queue, core.TaskQueue()]
+        # Virtual time of each priority, for weighted scheduling
+        self.passes = [0, 0, 0]
+        # Earliest key of the tasks of low and high priority, or None if there
+        # are none.  Until then only normal tasks can be ready, so there is
+        # nothing to choose.  Removing a task may leave it early, which only
+        # means choosing once more than needed.
+        self._wake = None
+
+    def _queue(self, task):
+        return self.queues[core._priorities.get(task, core.PRIORITY_NORMAL)]
+
+    def push(self, v, key=None):
+        i = core._priorities.get(v, core.PRIORITY_NORMAL)
+        self.queues[i].push(v, key)
+        if i != core.PRIORITY_NORMAL:
+            wake = self._wake
+            if wake is None or core.ticks_diff(v.ph_key, wake) < 0:
+                self._wake = v.ph_key
+
+    def remove(self, v):
+        self._queue(v).remove(v)
+
+    def _normal(self):
+        # Whether the head of the normal queue is the task to run next without
+        # having to choose, because no task of another priority is due before it
+        # or before now.  The run loop reads the time just before it pops, so
+        # use that rather than reading the clock again.  When peeking it may be a
+        # step old, but that only affects which of the ready tasks is taken.
+        wake = self._wake
+        if wake is None:
+            return True
+        t = self.queues[1].peek()
+        return (
+            t
+            and core.ticks_diff(t.ph_key, wake) < 0
+            and core.ticks_diff(core._slice_start, wake) < 0
+        )
+
+    def _select(self):
+        # Return the index of the queue to take the next task from, or -1 if empty.
+        now = core._slice_start
+        queues = self.queues
+        passes = self.passes
+        chosen = -1  # Queue picked by the policy, of those with a ready task
+        first = -1  # Queue with the task that is ready first, if none is ready
+        first_key = 0
+        overdue = -1  # Queue whose ready task has waited longest beyond _max_wait
+        overdue_wait = _max_wait
+        self._wake = None
+        for i in (2, 1, 0):
+            t = queues[i].peek()
+            if not t:
+                continue
+            if i != 1 and (self._wake is None or core.ticks_diff(t.ph_key, self._wake) < 0):
+                self._wake = t.ph_key
+            wait = core.ticks_diff(now, t.ph_key)
+            if wait < 0:
+                if first < 0 or core.ticks_diff(t.ph_key, first_key) < 0:
+                    first = i
+                    first_key = t.ph_key
+            elif chosen < 0 or (_weights is not None and passes[i] < passes[chosen]):
+                chosen = i
+            if overdue_wait is not None and wait > overdue_wait:
+                overdue = i
+                overdue_wait = wait
+        if overdue >= 0:
+            return overdue
+        if chosen < 0:
+            return first
+        if _weights is not None:
+            # A priority with nothing ready doesn't save up time for later.
+            for i in (0, 1, 2):
+                if passes[i] < passes[chosen] and not self._ready(i, now):
+                    passes[i] = passes[chosen]
+        return chosen
+
+    def _ready(self, i, now):
+        t = self.queues[i].peek()
+        return t and core.ticks_diff(now, t.ph_key) >= 0
+
+    def peek(self):
+        if self._normal():
+            return self.queues[1].peek()
+        i = self._select()
+        return self.queues[i].peek() if i >= 0 else None
+
+    def pop(self):
+        if self._normal():
+            # Normal tasks running alone aren't charged, as the other priorities
+            # would have been brought level with them.
+            return self.queues[1].pop()
+        i = self._select()
+        if _weights is not None:
+            passes = self.passes
+            passes[i] += _STRIDE // _weights[i]
+            if passes[i] > 1 << 24:
+                base = min(passes)
+                for j in (0, 1, 2):
+                    passes[j] -= base
+        return self.queues[i].pop()
+
+
+def _prioritise(task, priority):
+    # Give a new task, that is not queued yet, a priority other than PRIORITY_NORMAL.
+    if priority not in {core.PRIORITY_LOW, core.PRIORITY_HIGH}:
+        raise ValueError("invalid priority")
+    if not isinstance(core._task_queue, _ReadyQueues):
+        if not isinstance(core._task_queue, core.TaskQueue):
+            raise RuntimeError("priorities can't be used with deadlines")
+        core._task_queue = _ReadyQueues(core._task_queue)
+    core._priorities[task] = priority
+
+
+def set_priority_policy(weights=None, max_wait=None):
+    """Set how the event loop chooses between ready tasks of different
+    priorities.
+
+    If *weights* is ``None`` (the default) then priorities are strict: a task
+    only runs when no task of higher priority is ready.  Otherwise *weights* is
+    a tuple of three positive integers, for `PRIORITY_LOW`, `PRIORITY_NORMAL` and
+    `PRIORITY_HIGH`, and each priority with ready tasks gets a share of the
+    task switches in proportion to its weight.  For example, with weights of
+    ``(1, 4, 16)`` and tasks of every priority always ready, 16 high priority
+    tasks run for every 4 normal and 1 low priority tasks.
+
+    If *max_wait* is not ``None`` then a task that has been ready for more than
+    *max_wait* milliseconds runs next whatever its priority, which stops tasks
+    of low priority being starved of time.
+    """
+
+    global _weights, _max_wait
+    if weights is not None:
+        if len(weights) != 3 or min(weights) < 1:
+            raise ValueError("weights must be 3 positive integers")
+        weights = tuple(weights)
+    _weights = weights
+    _max_wait = max_wait
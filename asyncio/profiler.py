@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Sampling profiler
+=================
+
+A general purpose profiler sees the event loop's ``coro.send()`` calls, not
+which tasks awaited which.  `Profiler` samples the logical stack of the running
+task instead: the tasks that await it (outermost first), then the coroutines it
+is running.  The samples are counted per stack, in the collapsed stack format
+read by flame graph tools (``flamegraph.pl``, speedscope...)::
+
+    main;serve;handle_request;parse 42
+
+Where there is ``signal.setitimer()`` (CPython on Unix), a ``SIGPROF`` signal
+takes a sample every *interval* seconds of CPU time (or as often as the
+operating system allows), with the coroutine frames of the running task, and
+the time the event loop spends between steps counts as ``<loop>``.  Elsewhere the event loop takes the samples between task steps: each
+*interval* of time spent running tasks counts as a sample of the task running at
+the end of it, with the coroutines it was in when it last waited.  Either way,
+time spent waiting for IO or timers isn't sampled.
+"""
+
+from . import core, monitor
+from .monitor import _coro_name, _us
+
+try:
+    import signal
+
+    _setitimer = signal.setitimer
+except (ImportError, AttributeError):
+    _setitimer = None
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return getattr(code, "co_qualname", code.co_name)
+
+
+def _awaits(coro, names):
+    # Append the names of coroutine coro and those it awaits (when it has
+    # cr_await, as on CPython).
+    names.append(_coro_name(coro))
+    aw = getattr(coro, "cr_await", None)
+    while aw is not None and hasattr(aw, "__qualname__"):
+        names.append(aw.__qualname__)
+        aw = getattr(aw, "cr_await", None) or getattr(aw, "gi_yieldfrom", None)
+
+
+def _awaiting(t):
+    # Return the names of the coroutines of the tasks awaiting task t, outermost
+    # first, following the queue of waiters in Task.state.
+    chain = []
+    depth = 0
+    while depth < 16:
+        waiters = t.state
+        if not hasattr(waiters, "peek"):
+            break
+        t = waiters.peek()
+        if t is None:
+            break
+        names = []
+        _awaits(t.coro, names)
+        chain.append(names)
+        depth += 1
+    names = []
+    for i in range(len(chain) - 1, -1, -1):
+        names.extend(chain[i])
+    return names
+
+
+class _StepSampler(monitor.Monitor):
+    # Takes samples between steps, where there are no threads.
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.running = None
+        self.step_start = 0
+        # Time spent running tasks since the last sample, in microseconds
+        self.carry = 0
+
+    def resumed(self, t):
+        self.running = t
+        self.step_start = _us()
+
+    def suspended(self):
+        t = self.running
+        if t is None:
+            return
+        self.running = None
+        self.carry += _us() - self.step_start
+        interval = self.profiler._interval_us
+        if self.carry < interval:
+            return
+        n = self.carry // interval
+        self.carry -= n * interval
+        names = _awaiting(t)
+        _awaits(t.coro, names)
+        self.profiler._add(names, n)
+
+
+class Profiler:
+    """Sample the logical stack of the running task every *interval* seconds.
+
+    Use `start` and `stop`, or the profiler as a context manager around the
+    code that runs the event loop::
+
+        profiler = asyncio.Profiler(0.001)
+        with profiler:
+            asyncio.run(main())
+        print(profiler.collapsed())
+    """
+
+    def __init__(self, interval=0.001):
+        self._interval = interval
+        self._interval_us = max(1, int(interval * 1000000))
+        self.stacks = {}
+        """Dict mapping each stack sampled, as names separated by ``;``, to its
+        number of samples."""
+        # Signal handler replaced while sampling with signals
+        self._previous = None
+        self._sampler = None
+
+    def _add(self, names, n=1):
+        key = ";".join(names) if names else "<loop>"
+        self.stacks[key] = self.stacks.get(key, 0) + n
+
+    def _signal(self, signum, frame):
+        # Sample the stack that the signal interrupted.
+        t = core.cur_task
+        root = getattr(t.coro, "cr_frame", None) if t is not None else None
+        names = []
+        f = frame
+        while f is not None and f is not root:
+            names.append(_frame_name(f))
+            f = f.f_back
+        if f is None:
+            # Not in a task.
+            self._add(["<loop>"])
+            return
+        names.append(_frame_name(f))
+        names.reverse()
+        self._add(_awaiting(t) + names)
+
+    def start(self):
+        """Start sampling.  When sampling with signals, this must be called
+        from the main thread, which runs the event loop.
+        """
+
+        self.stop()
+        if _setitimer is not None:
+            self._previous = signal.signal(signal.SIGPROF, self._signal)
+            _setitimer(signal.ITIMER_PROF, self._interval, self._interval)
+        else:
+            self._sampler = _StepSampler(self)
+            monitor.add(self._sampler)
+
+    def stop(self):
+        """Stop sampling."""
+
+        if self._previous is not None:
+            _setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous)
+            self._previous = None
+        if self._sampler is not None:
+            monitor.remove(self._sampler)
+            self._sampler = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def clear(self):
+        """Forget the samples taken so far."""
+
+        self.stacks = {}
+
+    def collapsed(self):
+        """Return the samples in collapsed stack format: a line per stack with
+        the names separated by ``;`` and the number of samples, most sampled
+        first.
+        """
+
+        items = sorted(self.stacks.items(), key=lambda item: -item[1])
+        return "".join(stack + " " + str(n) + "\n" for stack, n in items)
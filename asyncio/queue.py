@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Queues
+======
+"""
+
+from . import core
+from .event import Event
+from .waitqueue import WaitQueue
+
+
+class QueueEmpty(Exception):
+    """Raised by `Queue.get_nowait` when the queue is empty."""
+
+
+class QueueFull(Exception):
+    """Raised by `Queue.put_nowait` when the queue is full."""
+
+
+def _heappush(heap, item):
+    heap.append(item)
+    i = len(heap) - 1
+    while i:
+        parent = (i - 1) >> 1
+        if not item < heap[parent]:
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = item
+
+
+def _heappop(heap):
+    last = heap.pop()
+    if not heap:
+        return last
+    item = heap[0]
+    n = len(heap)
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and heap[child + 1] < heap[child]:
+            child += 1
+        if not heap[child] < last:
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = last
+    return item
+
+
+class Queue:
+    """A first in, first out queue for passing items between tasks.
+
+    If *maxsize* is greater than zero then the queue holds at most that many
+    items, and `Queue.put` waits for a free slot when it is full.  Otherwise the
+    queue is unbounded.
+
+    Tasks waiting on the queue are woken one at a time as items (or free slots)
+    become available, so a single item never wakes more than one consumer.
+    `Queue.get_many` and `Queue.put_many` move several items per task switch.
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        # Queues of Tasks waiting to get an item, and waiting for a free slot
+        self._getters = WaitQueue("queue")
+        self._putters = WaitQueue("queue")
+        # Number of items put but not yet marked as done with task_done()
+        self._unfinished = 0
+        self._finished = Event()
+        self._finished.set()
+        self._init()
+
+    # The item storage, which is overridden by LifoQueue and PriorityQueue.
+
+    def _init(self):
+        # Items are taken from index _head onwards, and the used part of the
+        # list is dropped once it is at least half of it.
+        self._items = []
+        self._head = 0
+
+    def _qsize(self):
+        return len(self._items) - self._head
+
+    def _put(self, item):
+        self._items.append(item)
+
+    def _get(self):
+        items = self._items
+        head = self._head
+        item = items[head]
+        head += 1
+        if head == len(items):
+            items.clear()
+            head = 0
+        elif head >= 32 and head * 2 >= len(items):
+            del items[:head]
+            head = 0
+        else:
+            items[head - 1] = None
+        self._head = head
+        return item
+
+    async def _wait(self, waiting, blocked):
+        # Park the calling task on the waiting queue for as long as blocked() is true.
+        while blocked():
+            waiting.push(core.cur_task)
+            # Set calling task's data to the waiting queue so it can be removed if needed
+            core.cur_task.data = waiting
+            try:
+                await core._never()
+            except core.CancelledError as er:
+                # Pass the wake-up on, in case it was meant for this task.
+                if not blocked():
+                    waiting.wake()
+                raise er
+
+    def _added(self, n):
+        # n items were put in the queue.
+        if n:
+            self._unfinished += n
+            self._finished.clear()
+            self._getters.wake(n)
+
+    def qsize(self):
+        """Return the number of items in the queue."""
+
+        return self._qsize()
+
+    def empty(self):
+        """Return ``True`` if the queue is empty, ``False`` otherwise."""
+
+        return not self._qsize()
+
+    def full(self):
+        """Return ``True`` if there are `maxsize` items in the queue.  A queue
+        with a *maxsize* of zero is never full.
+        """
+
+        return 0 < self.maxsize <= self._qsize()
+
+    def put_nowait(self, item):
+        """Put *item* into the queue without waiting.  Raises `QueueFull` if the
+        queue is full.
+        """
+
+        if self.full():
+            raise QueueFull
+        self._put(item)
+        self._added(1)
+
+    async def put(self, item):
+        """Put *item* into the queue, first waiting for a free slot if the queue
+        is full.
+        """
+
+        if self.full():
+            await self._wait(self._putters, self.full)
+        self.put_nowait(item)
+
+    async def put_many(self, items):
+        """Put all of *items* into the queue, in order, waiting for free slots as
+        needed.  Waiting consumers are woken once per batch of items rather than
+        once per item.
+        """
+
+        n = 0
+        for item in items:
+            if self.full():
+                # Hand over what has been put so far before waiting for space.
+                self._added(n)
+                n = 0
+                await self._wait(self._putters, self.full)
+            self._put(item)
+            n += 1
+        self._added(n)
+
+    def get_nowait(self):
+        """Remove and return an item from the queue without waiting.  Raises
+        `QueueEmpty` if the queue is empty.
+        """
+
+        if not self._qsize():
+            raise QueueEmpty
+        item = self._get()
+        self._putters.wake()
+        return item
+
+    async def get(self):
+        """Remove and return an item from the queue, first waiting for one if
+        the queue is empty.
+        """
+
+        if not self._qsize():
+            await self._wait(self._getters, self.empty)
+        return self.get_nowait()
+
+    async def get_many(self, max_items):
+        """Remove and return a list of up to *max_items* items from the queue,
+        first waiting for at least one if the queue is empty.
+        """
+
+        if not self._qsize():
+            await self._wait(self._getters, self.empty)
+        n = min(max_items, self._qsize())
+        items = [self._get() for _ in range(n)]
+        self._putters.wake(n)
+        return items
+
+    def task_done(self):
+        """Indicate that an item taken from the queue has been processed.  Each
+        `Queue.get` (or item of `Queue.get_many`) should be followed by a call to
+        `Queue.task_done` once the item is dealt with.
+        """
+
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if not self._unfinished:
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every item put into the queue has been taken and marked as
+        done with `Queue.task_done`.
+        """
+
+        await self._finished.wait()
+
+
+class LifoQueue(Queue):
+    """A last in, first out variant of `Queue`."""
+
+    def _init(self):
+        self._items = []
+
+    def _qsize(self):
+        return len(self._items)
+
+    def _put(self, item):
+        self._items.append(item)
+
+    def _get(self):
+        return self._items.pop()
+
+
+class PriorityQueue(Queue):
+    """A variant of `Queue` that returns the lowest item first.  Items are
+    typically tuples of the form ``(priority, data)``.
+    """
+
+    def _init(self):
+        self._items = []
+
+    def _qsize(self):
+        return len(self._items)
+
+    def _put(self, item):
+        _heappush(self._items, item)
+
+    def _get(self):
+        return _heappop(self._items)
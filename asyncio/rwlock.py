@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Reader-writer locks
+===================
+"""
+
+from . import core
+from .waitqueue import WaitQueue
+
+
+class _Side:
+    # Async context manager for one side of an RWLock.
+    def __init__(self, acquire, release):
+        self.acquire = acquire
+        self.release = release
+
+    async def __aenter__(self):
+        return await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.release()
+
+
+class RWLock:
+    """Create a new reader-writer lock.  Any number of tasks can hold the lock
+    for reading at the same time, or a single task can hold it for writing.
+
+    Once a writer is waiting, tasks that then ask for read access wait behind it,
+    so a stream of readers can't keep a writer out.  When a writer releases the
+    lock, all the readers waiting at that point are let in together, followed by
+    the next writer.
+
+    Use the `RWLock.reader` and `RWLock.writer` attributes in an ``async with``
+    statement::
+
+        lock = asyncio.RWLock()
+        async with lock.reader:
+            value = table[key]
+        async with lock.writer:
+            table[key] = value
+    """
+
+    def __init__(self):
+        # Number of tasks holding the lock for reading
+        self._readers = 0
+        # Whether a task holds the lock for writing
+        self._writer = False
+        # Queues of Tasks waiting to read and to write
+        self.read_waiting = WaitQueue("rwlock")
+        self.write_waiting = WaitQueue("rwlock")
+        # Tasks that have been handed the lock and scheduled to take it
+        self._woken = set()
+        self.reader = _Side(self.acquire_read, self.release_read)
+        """Async context manager that holds the lock for reading."""
+        self.writer = _Side(self.acquire_write, self.release_write)
+        """Async context manager that holds the lock for writing."""
+
+    def locked(self):
+        """Returns ``True`` if the lock is held for reading or writing, otherwise
+        ``False``.
+        """
+
+        return self._writer or self._readers > 0
+
+    def _wake(self, task):
+        self._woken.add(task)
+        core._task_queue.push(task)
+
+    def _admit_readers(self):
+        # Hand the lock to all the waiting readers.
+        while self.read_waiting.peek():
+            self._readers += 1
+            self._wake(self.read_waiting.pop())
+
+    async def _wait(self, waiting, release):
+        waiting.push(core.cur_task)
+        # Set calling task's data to the waiting queue so it can be removed if needed
+        core.cur_task.data = waiting
+        try:
+            await core._never()
+        except core.CancelledError as er:
+            if core.cur_task in self._woken:
+                # Cancelled while pending on resume, pass the lock on
+                self._woken.remove(core.cur_task)
+                release()
+            elif waiting is self.write_waiting and not self._writer and not waiting.peek():
+                # The last waiting writer left, let in the readers queued behind it.
+                self._admit_readers()
+            raise er
+        self._woken.remove(core.cur_task)
+
+    async def acquire_read(self):
+        """Wait until the lock can be held for reading, then take it."""
+
+        if self._writer or self.write_waiting.peek():
+            # The lock is handed over already counted as a reader.
+            await self._wait(self.read_waiting, self.release_read)
+        else:
+            self._readers += 1
+        return True
+
+    def release_read(self):
+        """Release the lock held for reading.  The last reader to release it
+        hands it to the next waiting writer, if any.
+        """
+
+        if self._readers <= 0:
+            raise RuntimeError("RWLock not acquired for reading")
+        self._readers -= 1
+        if self.write_waiting.peek():
+            if not self._readers:
+                self._writer = True
+                self._wake(self.write_waiting.pop())
+        else:
+            # No writer to wait behind any more.
+            self._admit_readers()
+
+    async def acquire_write(self):
+        """Wait until the lock can be held for writing, then take it."""
+
+        if self._writer or self._readers:
+            # The lock is handed over already marked as held by a writer.
+            await self._wait(self.write_waiting, self.release_write)
+        else:
+            self._writer = True
+        return True
+
+    def release_write(self):
+        """Release the lock held for writing.  It is handed to all the waiting
+        readers if there are any, otherwise to the next waiting writer.
+        """
+
+        if not self._writer:
+            raise RuntimeError("RWLock not acquired for writing")
+        self._writer = False
+        if self.read_waiting.peek():
+            self._admit_readers()
+        elif self.write_waiting.peek():
+            self._writer = True
+            self._wake(self.write_waiting.pop())
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Semaphores
+==========
+"""
+
+from . import core
+from .waitqueue import WaitQueue
+
+
+class Semaphore:
+    """Create a new semaphore, which holds *value* permits.  Tasks acquire a
+    permit with `Semaphore.acquire` and give it back with `Semaphore.release`,
+    so at most *value* tasks can hold a permit at any one time.
+
+    Tasks waiting for a permit are served in the order they started waiting.
+
+    In addition to the methods below, semaphores can be used in an ``async
+    with`` statement.
+    """
+
+    def __init__(self, value=1):
+        if value < 0:
+            raise ValueError("Semaphore initial value must be >= 0")
+        # Number of permits available.  Permits released while tasks are waiting
+        # are handed to a waiting task directly, so this is only non-zero when no
+        # task is waiting.
+        self._value = value
+        # Queue of Tasks waiting to acquire a permit
+        self.waiting = WaitQueue("semaphore")
+        # Tasks that were handed a permit and have been scheduled to take it
+        self._woken = set()
+
+    def locked(self):
+        """Returns ``True`` if the semaphore can't be acquired immediately,
+        otherwise ``False``.
+        """
+
+        return self._value == 0
+
+    def release(self):
+        """Release a permit.  If any tasks are waiting then the permit goes to the
+        next one in the queue, which is scheduled to run.  Otherwise the number of
+        available permits goes up by one.
+        """
+
+        if self.waiting.peek():
+            # Task(s) waiting on the semaphore, hand the permit to the next Task
+            task = self.waiting.pop()
+            self._woken.add(task)
+            core._task_queue.push(task)
+        else:
+            self._value += 1
+
+    async def acquire(self):
+        """Wait for a permit to be available and then take it."""
+
+        if self._value > 0:
+            self._value -= 1
+            return True
+        # No permit available, put the calling Task on the waiting queue
+        self.waiting.push(core.cur_task)
+        # Set calling task's data to the semaphore's queue so it can be removed if needed
+        core.cur_task.data = self.waiting
+        try:
+            await core._never()
+        except core.CancelledError as er:
+            if core.cur_task in self._woken:
+                # Cancelled while pending on resume, pass the permit on
+                self._woken.remove(core.cur_task)
+                self.release()
+            raise er
+        self._woken.remove(core.cur_task)
+        return True
+
+    async def __aenter__(self):
+        return await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.release()
+
+
+class BoundedSemaphore(Semaphore):
+    """A `Semaphore` that raises a ``ValueError`` from `Semaphore.release` if
+    the number of available permits would go above the initial *value*.
+    """
+
+    def __init__(self, value=1):
+        super().__init__(value)
+        self._bound_value = value
+
+    def release(self):
+        # Permits handed to woken tasks that have not taken them yet are not
+        # held, so count them as available.
+        if self._value + len(self._woken) >= self._bound_value:
+            raise ValueError("BoundedSemaphore released too many times")
+        super().release()
@@ -16,6 +16,14 @@
 from . import core
 
 
+# CIRCUITPY-CHANGE: added
+# Convert an optional timeout in seconds to a deadline in ticks for the IOQueue.
+def _deadline(timeout):
+    if timeout is None:
+        return None
+    return core.ticks_add(core.ticks(), int(timeout * 1000))
+
+
 class Stream:
     #CIRCUITPY-CHANGE: doc
     """This represents a TCP stream connection. To minimise code this class
@@ -46,43 +54,59 @@ class Stream:
         """
 
         # TODO yield?
+        # CIRCUITPY-CHANGE: keep the TLS session, which may only have become
+        # resumable once session tickets arrived after the handshake
+        if "session_key" in self.e:
+            _save_session(self.e["session_key"], self.s)
         self.s.close()
 
-    # CIRCUITPY-CHANGE: async
-    async def read(self, n):
+    # CIRCUITPY-CHANGE: async, timeout
+    async def read(self, n, timeout=None):
         # CIRCUITPY-CHANGE: doc
         """Read up to *n* bytes and return them.
+
+        If *timeout* is given and no data arrives within *timeout* seconds then
+        ``asyncio.TimeoutError`` is raised.
         """
 
-        await core._io_queue.queue_read(self.s)
+        await core._io_queue.queue_read(self.s, _deadline(timeout))
         return self.s.read(n)
 
-    # CIRCUITPY-CHANGE: async
-    async def readinto(self, buf):
+    # CIRCUITPY-CHANGE: async, timeout
+    async def readinto(self, buf, timeout=None):
         """Read up to n bytes into *buf* with n being equal to the length of *buf*
 
         Return the number of bytes read into *buf*
 
+        If *timeout* is given and no data arrives within *timeout* seconds then
+        ``asyncio.TimeoutError`` is raised.
+
         This is a MicroPython extension.
         """
 
         # CIRCUITPY-CHANGE: await, not yield
-        await core._io_queue.queue_read(self.s)
+        await core._io_queue.queue_read(self.s, _deadline(timeout))
         return self.s.readinto(buf)
 
-    # CIRCUITPY-CHANGE: async
-    async def readexactly(self, n):
+    # CIRCUITPY-CHANGE: async, timeout
+    async def readexactly(self, n, timeout=None):
         # CIRCUITPY-CHANGE: doc
         """Read exactly *n* bytes and return them as a bytes object.
 
         Raises an ``EOFError`` exception if the stream ends before reading
         *n* bytes.
+
+        If *timeout* is given and the *n* bytes have not all arrived within
+        *timeout* seconds then ``asyncio.TimeoutError`` is raised, and any bytes
+        read so far are lost.
        """
 
+        # CIRCUITPY-CHANGE: one deadline for the whole read
+        deadline = _deadline(timeout)
         r = b""
         while n:
             # CIRCUITPY-CHANGE: await, not yield
-            await core._io_queue.queue_read(self.s)
+            await core._io_queue.queue_read(self.s, deadline)
             r2 = self.s.read(n)
             if r2 is not None:
                 if not len(r2):
@@ -91,16 +115,22 @@ class Stream:
                 n -= len(r2)
         return r
 
-    # CIRCUITPY-CHANGE: async
-    async def readline(self):
+    # CIRCUITPY-CHANGE: async, timeout
+    async def readline(self, timeout=None):
         # CIRCUITPY-CHANGE: doc
         """Read a line and return it.
+
+        If *timeout* is given and a whole line has not arrived within *timeout*
+        seconds then ``asyncio.TimeoutError`` is raised, and any part of the line
+        read so far is lost.
         """
 
+        # CIRCUITPY-CHANGE: one deadline for the whole line
+        deadline = _deadline(timeout)
         l = b""
         while True:
             # CIRCUITPY-CHANGE: await, not yield
-            await core._io_queue.queue_read(self.s)
+            await core._io_queue.queue_read(self.s, deadline)
             l2 = self.s.readline()  # may do multiple reads but won't block
             if l2 is None:
                 continue
@@ -123,23 +153,34 @@ class Stream:
                 buf = buf[ret:]
         self.out_buf += buf
 
-    # CIRCUITPY-CHANGE: async
-    async def drain(self):
+    # CIRCUITPY-CHANGE: async, timeout
+    async def drain(self, timeout=None):
         # CIRCUITPY-CHANGE: doc
         """Drain (write) all buffered output data out to the stream.
+
+        If *timeout* is given and the data has not all been written within
+        *timeout* seconds then ``asyncio.TimeoutError`` is raised. The data that
+        was not written remains buffered.
         """
         if not self.out_buf:
             # Drain must always yield, so a tight loop of write+drain can't block the scheduler.
             # CIRCUITPYTHON-CHANGE: await
             return (await core.sleep_ms(0))
+        # CIRCUITPY-CHANGE: one deadline for the whole drain
+        deadline = _deadline(timeout)
         mv = memoryview(self.out_buf)
         off = 0
-        while off < len(mv):
-            # CIRCUITPY-CHANGE: await, not yield
-            await core._io_queue.queue_write(self.s)
-            ret = self.s.write(mv[off:])
-            if ret is not None:
-                off += ret
+        # CIRCUITPY-CHANGE: keep what was not written if the deadline passes
+        try:
+            while off < len(mv):
+                # CIRCUITPY-CHANGE: await, not yield
+                await core._io_queue.queue_write(self.s, deadline)
+                ret = self.s.write(mv[off:])
+                if ret is not None:
+                    off += ret
+        except core.TimeoutError as er:
+            self.out_buf = self.out_buf[off:]
+            raise er
         self.out_buf = b""
 
 
@@ -148,6 +189,63 @@ StreamReader = Stream
 StreamWriter = Stream
 
 
+# CIRCUITPY-CHANGE: drive the TLS handshake explicitly
+# Perform the handshake of a non-blocking SSL socket, waiting on the IOQueue in the
+# direction that the SSL layer asks for.
+async def _handshake(s):
+    if not hasattr(s, "do_handshake"):
+        # The handshake will happen implicitly on the first read or write.
+        return
+    import ssl as _ssl
+
+    from uerrno import EAGAIN
+
+    want_read = getattr(_ssl, "SSLWantReadError", ())
+    want_write = getattr(_ssl, "SSLWantWriteError", ())
+    while True:
+        try:
+            s.do_handshake()
+            return
+        except OSError as er:
+            if isinstance(er, want_write):
+                await core._io_queue.queue_write(s)
+            elif isinstance(er, want_read) or er.errno == EAGAIN:
+                await core._io_queue.queue_read(s)
+            else:
+                raise er
+
+
+# CIRCUITPY-CHANGE: TLS session resumption
+# Client-side TLS sessions, keyed by (host, port, SSLContext, server_hostname), so that
+# reconnecting to the same server can skip the full handshake where supported.
+_sessions = {}
+_SESSIONS_MAX = 8
+
+
+def _save_session(key, s):
+    session = getattr(s, "session", None)
+    if session is None:
+        return
+    _sessions.pop(key, None)
+    if len(_sessions) >= _SESSIONS_MAX:
+        # Forget the least recently stored session.
+        del _sessions[next(iter(_sessions))]
+    _sessions[key] = session
+
+
+# CIRCUITPY-CHANGE: the SSLContext used for ssl=True, created on first use
+_ssl_context = None
+
+
+def _default_ssl_context():
+    global _ssl_context
+    if _ssl_context is None:
+        import ssl as _ssl
+
+        _ssl_context = _ssl.SSLContext(_ssl.PROTOCOL_TLS_CLIENT)
+    return _ssl_context
+
+
 # Create a TCP stream connection to a remote host
 # CIRCUITPY-CHANGE: async
 async def open_connection(host, port, ssl=None, server_hostname=None):
@@ -155,6 +253,11 @@ async def open_connection(host, port, ssl=None, server_hostname=None):
     """Open a TCP connection to the given *host* and *port*. The *host* address will
     be resolved using `socket.getaddrinfo`, which is currently a blocking call.
 
+    If *ssl* is ``True`` or an ``SSLContext`` then the connection is wrapped with TLS,
+    and the TLS handshake is completed before returning. Where the ``ssl`` module
+    supports it, the TLS session is remembered and resumed by later connections to
+    the same server.
+
     Returns a pair of streams: a reader and a writer stream. Will raise a socket-specific
     ``OSError`` if the host could not be resolved or if the connection could not be made.
     """
@@ -174,15 +277,33 @@ async def open_connection(host, port, ssl=None, server_hostname=None):
     # wrap with SSL, if requested
     if ssl:
         if ssl is True:
-            import ssl as _ssl
-
-            ssl = _ssl.SSLContext(_ssl.PROTOCOL_TLS_CLIENT)
+            # CIRCUITPY-CHANGE: share one context, which is part of the session key
+            ssl = _default_ssl_context()
         if not server_hostname:
             server_hostname = host
-        s = ssl.wrap_socket(s, server_hostname=server_hostname, do_handshake_on_connect=False)
+        # CIRCUITPY-CHANGE: resume a previous TLS session, if there is one
+        key = (host, port, ssl, server_hostname)
+        session = _sessions.get(key)
+        if session is None:
+            s = ssl.wrap_socket(s, server_hostname=server_hostname, do_handshake_on_connect=False)
+        else:
+            s = ssl.wrap_socket(
+                s, server_hostname=server_hostname, do_handshake_on_connect=False, session=session
+            )
         s.setblocking(False)
-    ss = Stream(s)
+        ss = Stream(s, {"session_key": key})
+    # CIRCUITPY-CHANGE: ss is only created here for plain TCP
+    else:
+        ss = Stream(s)
     await core._io_queue.queue_write(s)
+    # CIRCUITPY-CHANGE: complete the TLS handshake before handing out the stream
+    if ssl:
+        try:
+            await _handshake(s)
+        except BaseException as er:
+            s.close()
+            raise er
+        _save_session(key, s)
     return ss, ss
 
 
@@ -241,22 +362,40 @@ class Server:
                 try:
                     s2 = ssl.wrap_socket(s2, server_side=True, do_handshake_on_connect=False)
                 except OSError as e:
-                    core.sys.print_exception(e)
+                    # CIRCUITPY-CHANGE: use CircuitPython traceback printing
+                    core.print_exception(None, e, e.__traceback__)
                     s2.close()
                     continue
             s2.setblocking(False)
             s2s = Stream(s2, {"peername": addr})
-            core.create_task(cb(s2s, s2s))
+            # CIRCUITPY-CHANGE: handshake in the connection's task, not the accept loop
+            if ssl:
+                core.create_task(self._serve_tls(s2s, cb))
+            else:
+                core.create_task(cb(s2s, s2s))
+
+    # CIRCUITPY-CHANGE: complete the TLS handshake before calling the callback
+    async def _serve_tls(self, s2s, cb):
+        try:
+            await _handshake(s2s.s)
+        except Exception as e:
+            core.print_exception(None, e, e.__traceback__)
+            s2s.s.close()
+            return
+        await cb(s2s, s2s)
 
 
 # Helper function to start a TCP stream server, running as a new task
 # TODO could use an accept-callback on socket read activity instead of creating a task
-async def start_server(cb, host, port, backlog=5):
+# CIRCUITPY-CHANGE: add missing ssl argument, as in MicroPython
+async def start_server(cb, host, port, backlog=5, ssl=None):
     # CIRCUITPY-CHANGE: doc
     """Start a TCP server on the given *host* and *port*. The *cb* callback will be
     called with incoming, accepted connections, and be passed 2 arguments: reader
     writer streams for the connection.
 
+    If *ssl* is an ``SSLContext`` then incoming connections are wrapped with it.
+
     Returns a `Server` object.
     """
 
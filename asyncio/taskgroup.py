@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Task groups
+===========
+"""
+
+from . import core
+from .funcs import _add_done_callback
+
+try:
+    _BaseExceptionGroup = BaseExceptionGroup
+except NameError:
+    _BaseExceptionGroup = None
+
+
+class TaskGroup:
+    """An asynchronous context manager holding a group of tasks.  Tasks are added
+    with `TaskGroup.create_task`, and leaving the ``async with`` block waits for
+    all of them to finish::
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(read_sensor())
+            tg.create_task(update_display())
+        # Both tasks have finished here.
+
+    If a task raises an exception, all the other tasks in the group are cancelled,
+    as is the body of the ``async with`` block if it is still running.  Once
+    every task has finished, the exception is raised from the ``async with``
+    statement.  Where exception groups are available, an ``ExceptionGroup`` of
+    all the exceptions is raised, even if there is only one, as on CPython, so
+    that they can be handled with ``except*``.  Otherwise only the first exception
+    is raised.
+    """
+
+    def __init__(self):
+        self._parent = None
+        self._tasks = set()
+        self._errors = []
+        self._entered = False
+        self._exiting = False
+        self._aborting = False
+        self._waiter = None  # Parent task, while waiting for the tasks to finish
+        self._cb = self._done  # Bind once
+
+    async def __aenter__(self):
+        if self._entered:
+            raise RuntimeError("TaskGroup has already been entered")
+        self._entered = True
+        self._parent = core.cur_task
+        return self
+
+    def create_task(self, coro, priority=core.PRIORITY_NORMAL):
+        """Create a task from *coro* in this group, and return the new `Task`.
+        See `create_task` for *priority*.
+        """
+
+        if not self._entered:
+            raise RuntimeError("TaskGroup has not been entered")
+        if self._exiting and not self._tasks:
+            raise RuntimeError("TaskGroup is finished")
+        if self._aborting:
+            raise RuntimeError("TaskGroup is shutting down")
+        t = core.create_task(coro, priority)
+        _add_done_callback(t, self._cb)
+        self._tasks.add(t)
+        return t
+
+    def _done(self, t, er):
+        # Task "t" of the group has finished, with exception "er".
+        self._tasks.discard(t)
+        if not isinstance(er, (StopIteration, core.CancelledError)):
+            self._errors.append(er)
+            if not self._aborting:
+                self._abort()
+                if not self._exiting:
+                    # Interrupt the body of the async with block.
+                    self._parent.cancel()
+        if not self._tasks and self._waiter is not None:
+            # The last task finished, wake the parent (only once).
+            core._task_queue.push(self._waiter)
+            self._waiter = None
+
+    def _abort(self):
+        # Cancel all remaining tasks.
+        self._aborting = True
+        for t in list(self._tasks):
+            t.cancel()
+
+    def remove(self, task):
+        # The parent was cancelled while waiting for the tasks to finish.
+        self._waiter = None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._exiting = True
+        # Whether the parent task was cancelled by something other than this group.
+        cancelled = exc_type is core.CancelledError and not self._aborting
+        if exc_type is not None and not self._aborting:
+            self._abort()
+        if exc_type is not None and not issubclass(exc_type, core.CancelledError):
+            self._errors.insert(0, exc)
+        while self._tasks:
+            self._waiter = core.cur_task
+            core.cur_task.data = self
+            try:
+                await core._never()
+            except core.CancelledError:
+                cancelled = True
+                if not self._aborting:
+                    self._abort()
+        if self._errors:
+            errors = self._errors
+            self._errors = []
+            if _BaseExceptionGroup is not None:
+                raise _BaseExceptionGroup("unhandled errors in a TaskGroup", errors)
+            raise errors[0]
+        if cancelled:
+            raise core.CancelledError
+        # A CancelledError from aborting the group ends here.
+        return exc_type is core.CancelledError
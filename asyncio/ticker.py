@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Tickers
+=======
+
+A loop that does ``await asyncio.sleep(interval)`` runs a little less often than
+every *interval*, because the time its body takes and the time it waits for other
+tasks add up over the iterations.  A `Ticker` instead wakes at deadlines that are
+exactly *interval* apart, counted from when it was created::
+
+    async for tick in asyncio.Ticker(0.5):
+        led.value = not led.value
+
+If the loop falls more than an interval behind, the ticks it missed are skipped
+rather than run back to back, and counted in `Ticker.skipped`.  Waiting for a
+tick doesn't allocate any memory.
+"""
+
+from . import core
+
+
+class Ticker:
+    """An asynchronous iterator that yields itself every *interval* seconds.
+
+    The times are rounded to whole milliseconds.
+    """
+
+    def __init__(self, interval):
+        period = int(interval * 1000)
+        if period <= 0:
+            raise ValueError("interval must be at least 1 ms")
+        self._period = period
+        self._pending = False
+        self._stop = StopIteration(self)
+        self.deadline = core.ticks()
+        """The `adafruit_ticks.ticks_ms` value that the current tick was due at."""
+        self.count = 0
+        """The number of ticks so far."""
+        self.late = 0
+        """How many milliseconds after its deadline the current tick woke."""
+        self.skipped = 0
+        """The number of ticks skipped because the loop fell behind."""
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        assert not self._pending, "Check for a missing `await` in your code"
+        self.deadline = core.ticks_add(self.deadline, self._period)
+        self._pending = True
+        return self
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._pending:
+            # Wait for the deadline, like sleep_until().
+            self._pending = False
+            now = core.ticks()
+            deadline = self.deadline
+            core._task_queue.push(
+                core.cur_task, deadline if core.ticks_diff(deadline, now) > 0 else now
+            )
+            return None
+        # Woken up: account for the time since the deadline.
+        period = self._period
+        late = core.ticks_diff(core.ticks(), self.deadline)
+        if late >= period:
+            missed = late // period
+            self.skipped += missed
+            self.deadline = core.ticks_add(self.deadline, missed * period)
+            late -= missed * period
+        self.late = late
+        self.count += 1
+        self._stop.__traceback__ = None
+        raise self._stop
+
+
+async def _every(interval, coro_fn):
+    async for ticker in Ticker(interval):
+        await coro_fn(ticker)
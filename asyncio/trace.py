@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Tracing
+=======
+
+A `Tracer` installed with `add_tracer` is called by the event loop when a task
+is created, resumed, suspended and done.  When a task is suspended the tracer is
+also told why, as one of these reasons:
+
+* ``"sleep"``: sleeping or yielding to other tasks
+* ``"io_read"``, ``"io_write"``: waiting for a stream to be readable or writable
+* ``"task"``: waiting for other tasks (awaiting a task, `gather`, `TaskGroup`...)
+* ``"lock"``, ``"event"``, ``"semaphore"``, ``"condition"``, ``"barrier"``,
+  ``"rwlock"``, ``"queue"``, ``"pool"``: waiting on one of those
+* ``"wait"``: waiting on anything else
+
+`TraceRecorder` is a tracer that keeps the most recent events in a ring buffer
+and writes them as a Chrome trace, which can be viewed in Perfetto
+(https://ui.perfetto.dev) or ``chrome://tracing``, with a track per task showing
+its steps and what it waited on in between.
+
+When no tracer (or other instrumentation) is installed, the event loop only
+checks a global variable.
+"""
+
+from . import core, monitor
+from .monitor import _coro_name, _us
+
+
+class Tracer:
+    """Base class of tracers, whose methods do nothing.  Override the ones
+    needed.  They are called from the event loop, so should be quick and must
+    not ``await``.
+    """
+
+    def task_created(self, task):
+        """Called when *task* is created."""
+
+    def task_resumed(self, task):
+        """Called when the event loop is about to run a step of *task*."""
+
+    def task_suspended(self, task, reason):
+        """Called when *task* waits, after a step, for *reason* (see above)."""
+
+    def task_done(self, task):
+        """Called when *task* has finished, after its last step."""
+
+
+def _reason(t):
+    # Return why task t is waiting, from what it is linked to by t.data.
+    data = t.data
+    if data is None:
+        return "sleep"
+    if data is core._io_queue:
+        io_map = data.map
+        for k in io_map:  # Iterate without allocating on the heap
+            if io_map[k][1] is t:
+                return "io_write"
+        return "io_read"
+    if isinstance(data, core.Task):
+        return "task"
+    # WaitQueues say what they are for, anything else waits for tasks to finish.
+    return getattr(data, "reason", "task")
+
+
+class _TraceMonitor(monitor.Monitor):
+    # Calls the methods of a Tracer from the run loop.
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.running = None
+
+    def created(self, t):
+        self.tracer.task_created(t)
+
+    def resumed(self, t):
+        if not t.state:
+            # A finished task, run again to report its exception.
+            return
+        self.running = t
+        self.tracer.task_resumed(t)
+
+    def suspended(self):
+        t = self.running
+        if t is None:
+            return
+        self.running = None
+        if t.state:
+            self.tracer.task_suspended(t, _reason(t))
+        else:
+            self.tracer.task_done(t)
+
+
+# Maps each installed Tracer to its _TraceMonitor
+_tracers = {}
+
+
+def add_tracer(tracer):
+    """Install *tracer*, a `Tracer`."""
+
+    if tracer not in _tracers:
+        m = _tracers[tracer] = _TraceMonitor(tracer)
+        monitor.add(m)
+
+
+def remove_tracer(tracer):
+    """Uninstall *tracer*."""
+
+    m = _tracers.pop(tracer, None)
+    if m is not None:
+        monitor.remove(m)
+
+
+class TraceRecorder(Tracer):
+    """A `Tracer` that records the last *size* events, in a ring buffer, as
+    Chrome trace events.  Each step of a task is an event named after the task's
+    coroutine, and each wait between steps an event named after its reason.
+    """
+
+    def __init__(self, size=4096):
+        # Ring buffer of (phase, category, name, task id, start, duration), with
+        # times in microseconds
+        self._events = [None] * size
+        self._next = 0
+        self._full = False
+        # Start of the step being run
+        self._step_start = 0
+        # Maps each suspended task to (reason, time it was suspended)
+        self._waits = {}
+
+    def _add(self, event):
+        self._events[self._next] = event
+        self._next += 1
+        if self._next == len(self._events):
+            self._next = 0
+            self._full = True
+
+    def clear(self):
+        """Forget the events recorded so far."""
+
+        self._events = [None] * len(self._events)
+        self._next = 0
+        self._full = False
+        self._waits.clear()
+
+    def task_created(self, task):
+        self._add(("i", "task", "created", id(task), _us(), 0))
+
+    def task_resumed(self, task):
+        now = _us()
+        wait = self._waits.pop(task, None)
+        if wait is not None:
+            self._add(("X", "wait", wait[0], id(task), wait[1], now - wait[1]))
+        self._step_start = now
+
+    def _step(self, task, now):
+        start = self._step_start
+        self._add(("X", "step", _coro_name(task.coro), id(task), start, now - start))
+
+    def task_suspended(self, task, reason):
+        now = _us()
+        self._step(task, now)
+        self._waits[task] = (reason, now)
+
+    def task_done(self, task):
+        now = _us()
+        self._step(task, now)
+        self._add(("i", "task", "done", id(task), now, 0))
+
+    def events(self):
+        """Return the recorded events, oldest first, as tuples of ``(phase,
+        category, name, task id, start, duration)`` with times in microseconds.
+        """
+
+        if self._full:
+            events = self._events[self._next :] + self._events[: self._next]
+        else:
+            events = self._events[: self._next]
+        return events
+
+    def write(self, file):
+        """Write the recorded events to *file*, an object with a ``write()``
+        method such as an open file, as Chrome trace JSON.
+        """
+
+        import json
+
+        names = {}
+        file.write('{"traceEvents":[\n')
+        first = True
+        for ph, cat, name, tid, ts, dur in self.events():
+            if cat == "step":
+                names[tid] = name
+            event = {"name": name, "cat": cat, "ph": ph, "pid": 1, "tid": tid, "ts": ts}
+            if ph == "X":
+                event["dur"] = dur
+            else:
+                event["s"] = "t"
+            if not first:
+                file.write(",\n")
+            file.write(json.dumps(event))
+            first = False
+        for tid, name in names.items():
+            event = {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            if not first:
+                file.write(",\n")
+            file.write(json.dumps(event))
+            first = False
+        file.write("\n]}\n")
@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Note: not present in MicroPython asyncio
+
+"""
+Wait queues
+===========
+
+A first in, first out queue of the tasks waiting on a synchronisation primitive
+(`Event`, `Lock`...).  It has the ``push()``, ``peek()``, ``pop()`` and
+``remove()`` methods of `TaskQueue`, so it can stand in for one as the
+``data`` of a waiting task, but it keeps tasks in the order they arrived rather
+than ordered by time.  Adding and taking tasks are O(1), instead of the
+O(log N) pop of the pairing heap, and `WaitQueue.wake_all` empties the queue in
+a single pass over it.
+
+`WaitQueue.wake_all` still pushes the woken tasks onto `_task_queue` one at a
+time: `TaskQueue` has no way to insert many tasks at once, and the links of the
+pairing heap aren't accessible from Python with the C implementation.  Each
+push is an O(1) meld, so the time until every woken task has run is dominated
+by the run loop, and is about the same as with a `TaskQueue` of waiters.
+
+`Task` objects can't hold any links of their own (the C implementation only has
+``data`` and ``state``), so the tasks are kept in a list that is consumed from
+a head index.  A task removed from the middle of the queue, because it was
+cancelled, is left in the list and skipped when reached, which keeps removal
+O(1) amortised.
+
+A task can also wait with a deadline, in which case it is on `_task_queue` at the
+deadline as well.  If it is woken (or cancelled) first then it is taken off
+`_task_queue`, and if the deadline comes first then the run loop calls
+`WaitQueue.expire` and raises `TimeoutError` in the task.
+"""
+
+from . import core
+
+
+class WaitQueue:
+    def __init__(self, reason="wait"):
+        # What the tasks wait for ("lock", "event"...), as reported by asyncio.trace
+        self.reason = reason
+        # Tasks in arrival order, from index _head onwards, including removed ones
+        self._tasks = []
+        self._head = 0
+        # Number of tasks waiting
+        self._len = 0
+        # Maps each removed task to the number of its entries still in _tasks, or
+        # None if there are none.  The entries of a task that is removed and then
+        # pushed again come before its live entry, so skipping its first entries
+        # drops exactly the removed ones.
+        self._removed = None
+        self._stale = 0
+        # Set of the waiting tasks that are also on _task_queue with a deadline, or None
+        self._timed = None
+
+    def __len__(self):
+        return self._len
+
+    def _reset(self):
+        self._tasks.clear()
+        self._head = 0
+        self._len = 0
+        self._removed = None
+        self._stale = 0
+        self._timed = None
+
+    def _untime(self, task):
+        # Take a task that stops waiting off _task_queue, if it is there with a deadline.
+        timed = self._timed
+        if timed and task in timed:
+            timed.remove(task)
+            core._task_queue.remove(task)
+
+    def _skip(self):
+        # Drop removed tasks from the head of the queue, which must hold a live task.
+        removed = self._removed
+        tasks = self._tasks
+        head = self._head
+        while True:
+            n = removed.get(tasks[head])
+            if not n:
+                break
+            if n == 1:
+                del removed[tasks[head]]
+            else:
+                removed[tasks[head]] = n - 1
+            self._stale -= 1
+            tasks[head] = None
+            head += 1
+        self._head = head
+
+    def _compact(self):
+        # Rebuild the list without the removed tasks.
+        removed = self._removed
+        tasks = []
+        for i in range(self._head, len(self._tasks)):
+            t = self._tasks[i]
+            n = removed.get(t)
+            if not n:
+                tasks.append(t)
+            elif n == 1:
+                del removed[t]
+            else:
+                removed[t] = n - 1
+        self._tasks = tasks
+        self._head = 0
+        self._removed = None
+        self._stale = 0
+
+    def peek(self):
+        if not self._len:
+            return None
+        if self._removed:
+            self._skip()
+        return self._tasks[self._head]
+
+    def push(self, task, deadline=None):
+        # The caller then sets task.data to this queue, as for a TaskQueue.
+        if deadline is not None:
+            core._task_queue.push(task, deadline)
+            if self._timed is None:
+                self._timed = set()
+            self._timed.add(task)
+        self._tasks.append(task)
+        self._len += 1
+
+    def pop(self):
+        if self._removed:
+            self._skip()
+        tasks = self._tasks
+        head = self._head
+        task = tasks[head]
+        if self._timed:
+            self._untime(task)
+        self._len -= 1
+        if not self._len:
+            self._reset()
+            return task
+        tasks[head] = None
+        head += 1
+        if head >= 32 and head * 2 >= len(tasks):
+            # Drop the used part of the list once it is at least half of it.
+            del tasks[:head]
+            head = 0
+        self._head = head
+        return task
+
+    def remove(self, task):
+        if self._timed:
+            self._untime(task)
+        self._unlink(task)
+
+    # Called by the run loop when the deadline of a task passes while it is waiting.
+    # The task is already off _task_queue, so only take it off this queue.
+    def expire(self, task):
+        self._timed.remove(task)
+        self._unlink(task)
+
+    def _unlink(self, task):
+        self._len -= 1
+        if not self._len:
+            self._reset()
+            return
+        removed = self._removed
+        if self._tasks[-1] is task:
+            # The most recent entry of a task is its live one.
+            self._tasks.pop()
+            return
+        if removed is None:
+            removed = self._removed = {}
+        removed[task] = removed.get(task, 0) + 1
+        self._stale += 1
+        if self._stale > 16 and self._stale > self._len:
+            self._compact()
+
+    # Schedule up to n of the waiting tasks, in order.
+    def wake(self, n=1):
+        while n > 0 and self._len:
+            core._task_queue.push(self.pop())
+            n -= 1
+
+    # Schedule all the waiting tasks, in order, and empty the queue.  Each task is
+    # pushed onto _task_queue on its own, as it has no bulk insert.
+    def wake_all(self):
+        if not self._len:
+            return
+        tasks = self._tasks
+        removed = self._removed
+        timed = self._timed
+        push = core._task_queue.push
+        for i in range(self._head, len(tasks)):
+            t = tasks[i]
+            if removed:
+                n = removed.get(t)
+                if n:
+                    if n == 1:
+                        del removed[t]
+                    else:
+                        removed[t] = n - 1
+                    continue
+            if timed and t in timed:
+                core._task_queue.remove(t)
+            push(t)
+        self._reset()
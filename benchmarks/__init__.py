@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Benchmarks for the asyncio library.
+
+Run a benchmark from the root of the repository so that ``import asyncio``
+picks up this library rather than the CPython standard library module::
+
+    python -m benchmarks.bench_pool
+
+`benchmarks.suite` runs a standard set of benchmarks and writes the results as
+JSON, and `benchmarks.compare` compares two such files to find regressions::
+
+    python -m benchmarks.suite -o before.json
+    python -m benchmarks.suite -o after.json
+    python -m benchmarks.compare before.json after.json
+
+`benchmarks.parity` checks that implementations of ``Task`` and ``TaskQueue``
+behave alike and ranks their speed with the same suite.
+
+On CPython, importing this package first adapts the ``select``, ``socket``
+and ``ssl`` modules so that they offer the MicroPython-style APIs
+(``poll.ipoll()``, ``socket.read()``, ``socket.write()``...) that the library
+relies on.  On MicroPython and CircuitPython nothing is changed.
+"""
+
+import sys
+
+if sys.implementation.name == "cpython":
+    import errno
+    import select
+    import socket
+    import ssl
+
+    _poll = select.poll
+
+    class _Poll:
+        def __init__(self):
+            self._poll = _poll()
+            self._objs = {}
+
+        def register(self, obj, eventmask):
+            self._objs[obj.fileno()] = obj
+            self._poll.register(obj, eventmask)
+
+        def modify(self, obj, eventmask):
+            self._poll.modify(obj, eventmask)
+
+        def unregister(self, obj):
+            self._poll.unregister(obj)
+            del self._objs[obj.fileno()]
+
+        def poll(self, timeout=-1):
+            return self._poll.poll(timeout)
+
+        def ipoll(self, timeout=-1, flags=0):
+            objs = self._objs
+            return [(objs[fd], ev) for fd, ev in self._poll.poll(timeout)]
+
+    class _StreamMixin:
+        # Non-blocking stream methods as provided by MicroPython sockets: they
+        # return None rather than raising when the operation would block.
+        _would_block = (BlockingIOError, ssl.SSLWantReadError, ssl.SSLWantWriteError)
+
+        def read(self, n=-1):
+            try:
+                return self._recv(n if n > 0 else 4096)
+            except self._would_block:
+                return None
+
+        def readinto(self, buf):
+            try:
+                return self._recv_into(buf)
+            except self._would_block:
+                return None
+
+        def readline(self):
+            line = b""
+            while True:
+                try:
+                    c = self._recv(1)
+                except self._would_block:
+                    return line or None
+                line += c
+                if not c or c == b"\n":
+                    return line
+
+        def write(self, buf):
+            try:
+                return self._send(buf)
+            except self._would_block:
+                return None
+
+    class _Socket(_StreamMixin, socket.socket):
+        _recv = socket.socket.recv
+        _recv_into = socket.socket.recv_into
+        _send = socket.socket.send
+
+    class _SSLSocket(_StreamMixin, ssl.SSLSocket):
+        # SSLSocket.recv() and friends call self.read(), so go to the originals.
+        _recv = ssl.SSLSocket.read
+        _send = ssl.SSLSocket.write
+
+        def _recv_into(self, buf):
+            return ssl.SSLSocket.read(self, len(buf), buf)
+
+    select.poll = _Poll
+    socket.socket = _Socket
+    ssl.SSLContext.sslsocket_class = _SSLSocket
+    sys.modules.setdefault("uerrno", errno)
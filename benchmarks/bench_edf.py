@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Response times of a mix of periodic tasks, a 10 ms control loop with a 3 ms
+deadline and 20 ms logging tasks with a 20 ms deadline, next to busy bulk tasks,
+scheduled in FIFO order and earliest deadline first.
+
+Run with ``python -m benchmarks.bench_edf``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_add, ticks_diff, ticks_ms
+
+RUN = 2000
+BULK = 4
+
+
+def busy(ms):
+    # Simulate ms milliseconds of work.
+    end = ticks_add(ticks_ms(), ms)
+    while ticks_diff(end, ticks_ms()) > 0:
+        pass
+
+
+async def bulk(stop):
+    while not stop[0]:
+        busy(1)
+        await asyncio.sleep(0)
+
+
+async def periodic(period, cost, deadline, edf, stop, response):
+    # Each iteration is released at a multiple of period, and should finish its
+    # cost milliseconds of work within deadline milliseconds of its release.
+    release = ticks_ms()
+    while not stop[0]:
+        release = ticks_add(release, period)
+        delay = max(0, ticks_diff(release, ticks_ms()))
+        if edf:
+            await asyncio.sleep_ms_deadline(delay, deadline)
+        else:
+            await asyncio.sleep_ms(delay)
+        busy(cost)
+        response.append(ticks_diff(ticks_ms(), release))
+
+
+def report(name, response, deadline):
+    response.sort()
+    misses = sum(1 for r in response if r > deadline)
+    p99 = response[len(response) * 99 // 100]
+    print(
+        f"  {name}: {len(response)} runs, response {response[0]}..{response[-1]} ms, "
+        f"99th percentile {p99} ms, {misses} past the {deadline} ms deadline"
+    )
+
+
+async def measure(name, edf):
+    stop = [False]
+    control = []
+    logging = []
+    tasks = [asyncio.create_task(bulk(stop)) for _ in range(BULK)]
+    tasks.append(asyncio.create_task(periodic(10, 1, 3, edf, stop, control)))
+    for _ in range(3):
+        tasks.append(asyncio.create_task(periodic(20, 2, 20, edf, stop, logging)))
+    await asyncio.sleep_ms(RUN)
+    stop[0] = True
+    await asyncio.gather(*tasks)
+    print(f"{name}:")
+    report("control", control, 3)
+    report("logging", logging, 20)
+    if edf:
+        print(f"  misses counted by the scheduler: {asyncio.deadline_misses()}")
+
+
+async def main():
+    await measure("FIFO", False)
+    await measure("earliest deadline first", True)
+
+
+asyncio.run(main())
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Event fan-out to 10k waiters, with waiters kept on a TaskQueue (as Event did
+before) and on a WaitQueue.
+
+Run with ``python -m benchmarks.bench_event``.
+"""
+
+import asyncio
+from asyncio import core
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+WAITERS = 10000
+ROUNDS = 5
+
+
+class TaskQueueEvent:
+    # Event as it was, with the waiting tasks on a pairing heap.
+    def __init__(self):
+        self.state = False
+        self.waiting = core.TaskQueue()
+
+    def set(self):
+        while self.waiting.peek():
+            core._task_queue.push(self.waiting.pop())
+        self.state = True
+
+    def clear(self):
+        self.state = False
+
+    async def wait(self):
+        if not self.state:
+            self.waiting.push(core.cur_task)
+            core.cur_task.data = self.waiting
+            await core._never()
+        return True
+
+
+async def waiter(event, woken):
+    await event.wait()
+    woken[0] += 1
+
+
+async def measure(name, event_class):
+    set_ms = 0
+    wake_ms = 0
+    cancel_ms = 0
+    for _ in range(ROUNDS):
+        event = event_class()
+        woken = [0]
+        tasks = [asyncio.create_task(waiter(event, woken)) for _ in range(WAITERS)]
+        await asyncio.sleep(0)
+        start = ticks_ms()
+        event.set()
+        set_ms += ticks_diff(ticks_ms(), start)
+        await asyncio.sleep(0)
+        wake_ms += ticks_diff(ticks_ms(), start)
+        assert woken[0] == WAITERS
+
+        # Cancel every other waiter, then wake the rest.
+        event = event_class()
+        tasks = [asyncio.create_task(waiter(event, woken)) for _ in range(WAITERS)]
+        await asyncio.sleep(0)
+        start = ticks_ms()
+        for t in tasks[::2]:
+            t.cancel()
+        event.set()
+        await asyncio.sleep(0)
+        cancel_ms += ticks_diff(ticks_ms(), start)
+    print(
+        f"{name}: set() {set_ms / ROUNDS:.1f} ms, all woken {wake_ms / ROUNDS:.1f} ms, "
+        f"cancel half then set {cancel_ms / ROUNDS:.1f} ms"
+    )
+
+
+async def main():
+    await measure("TaskQueue", TaskQueueEvent)
+    await measure("WaitQueue", asyncio.Event)
+
+
+asyncio.run(main())
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Output and event loop stall when many detached tasks fail at once.
+
+``TASKS`` tasks fail, at one of two places, with nobody retrieving their
+exceptions.  With the default exception handler and with an
+``ExceptionAggregator``, this measures how much is printed, how long that would
+take on a 115200 baud serial console, and the longest the event loop went
+without running a heartbeat task.
+
+Run with ``python -m benchmarks.bench_exchandler``.
+"""
+
+import asyncio
+import io
+import sys
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+TASKS = 500
+BAUD = 115200
+
+
+async def connect(i):
+    await asyncio.sleep_ms(1)
+    if i % 2:
+        raise OSError("connection refused")
+    raise ValueError("bad reply")
+
+
+async def heartbeat(gaps):
+    last = ticks_ms()
+    while True:
+        await asyncio.sleep_ms(0)
+        now = ticks_ms()
+        gaps.append(ticks_diff(now, last))
+        last = now
+
+
+async def storm(handler):
+    if handler is not None:
+        asyncio.get_running_loop().set_exception_handler(handler)
+    gaps = []
+    beat = asyncio.create_task(heartbeat(gaps))
+    await asyncio.sleep_ms(0)
+    for i in range(TASKS):
+        asyncio.create_task(connect(i))
+    await asyncio.sleep_ms(50)
+    beat.cancel()
+    return max(gaps)
+
+
+def run(name, make_handler):
+    out = io.StringIO()
+    stderr = sys.stderr
+    sys.stderr = out
+    try:
+        handler = make_handler()
+        longest = asyncio.run(storm(handler))
+        if handler is not None:
+            handler.flush()
+    finally:
+        sys.stderr = stderr
+        asyncio.get_running_loop().set_exception_handler(None)
+    size = len(out.getvalue())
+    print(
+        f"{name}: {size} bytes printed, {size * 10 / BAUD:.2f} s at {BAUD} baud, longest loop stall {longest} ms"
+    )
+    return out.getvalue()
+
+
+run("default handler", lambda: None)
+summary = run("ExceptionAggregator", lambda: asyncio.ExceptionAggregator(burst=5, period=10))
+print("ExceptionAggregator output:")
+print(summary, end="")
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Throughput and peak memory of map_concurrent against a gather of all items.
+
+Run with ``python -m benchmarks.bench_map_concurrent``.
+"""
+
+import asyncio
+import gc
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+N = 100000
+LIMIT = 16
+
+
+async def job(i):
+    await asyncio.sleep_ms(0)
+    return i
+
+
+async def run_gather():
+    total = 0
+    for r in await asyncio.gather(*(job(i) for i in range(N))):
+        total += r
+    return total
+
+
+async def run_map_concurrent():
+    total = 0
+    async for r in asyncio.map_concurrent(job, range(N), limit=LIMIT):
+        total += r
+    return total
+
+
+def memory_start():
+    gc.collect()
+    if tracemalloc:
+        tracemalloc.start()
+        return 0
+    return gc.mem_alloc()
+
+
+def memory_peak(start):
+    if tracemalloc:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+    # Without tracemalloc, only the memory still in use at the end can be seen.
+    return gc.mem_alloc() - start
+
+
+async def measure(name, fn):
+    start_mem = memory_start()
+    start = ticks_ms()
+    total = await fn()
+    elapsed = max(1, ticks_diff(ticks_ms(), start))
+    peak = memory_peak(start_mem)
+    assert total == N * (N - 1) // 2
+    print(f"{name}: {N * 1000 / elapsed:.0f} items/s, peak memory {peak // 1024} KiB")
+
+
+async def main():
+    await measure("gather", run_gather)
+    await measure(f"map_concurrent(limit={LIMIT})", run_map_concurrent)
+
+
+asyncio.run(main())
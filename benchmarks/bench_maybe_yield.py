@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""A CPU-heavy task next to a 5 ms ticker: not yielding, yielding with
+``sleep(0)`` after every item, calling ``maybe_yield()`` after every item, and
+checking ``should_yield()`` after every item.
+
+Run with ``python -m benchmarks.bench_maybe_yield``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_add, ticks_diff, ticks_ms
+
+ITEMS = 200000
+PERIOD = 5
+
+
+def crunch(i):
+    return (i * i) % 7
+
+
+async def no_yield():
+    for i in range(ITEMS):
+        crunch(i)
+
+
+async def sleep_0():
+    for i in range(ITEMS):
+        crunch(i)
+        await asyncio.sleep(0)
+
+
+async def maybe_yield():
+    for i in range(ITEMS):
+        crunch(i)
+        await asyncio.maybe_yield()
+
+
+async def should_yield():
+    for i in range(ITEMS):
+        crunch(i)
+        if asyncio.should_yield():
+            await asyncio.sleep(0)
+
+
+async def ticker(lateness):
+    while True:
+        deadline = ticks_add(ticks_ms(), PERIOD)
+        await asyncio.sleep_ms(PERIOD)
+        lateness.append(max(0, ticks_diff(ticks_ms(), deadline)))
+
+
+async def measure(name, fn):
+    lateness = []
+    task = asyncio.create_task(ticker(lateness))
+    await asyncio.sleep(0)
+    start = ticks_ms()
+    await fn()
+    ms = ticks_diff(ticks_ms(), start)
+    task.cancel()
+    print(f"{name}: {ms} ms, ticker worst lateness {max(lateness, default=ms)} ms")
+
+
+async def main():
+    await measure("no yield", no_yield)
+    await measure("sleep(0) per item", sleep_0)
+    await measure("maybe_yield() per item", maybe_yield)
+    await measure("should_yield() per item", should_yield)
+    asyncio.Loop.set_slice_budget(2)
+    await measure("maybe_yield() per item, 2 ms budget", maybe_yield)
+    await measure("should_yield() per item, 2 ms budget", should_yield)
+
+
+asyncio.run(main())
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Task switches per second with scheduler metrics disabled and enabled, and
+the metrics recorded for a small mixed workload.
+
+Run with ``python -m benchmarks.bench_metrics``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+TASKS = 100
+STEPS = 2000
+
+
+async def yielder():
+    for _ in range(STEPS):
+        await asyncio.sleep(0)
+
+
+async def switches(name):
+    start = ticks_ms()
+    await asyncio.gather(*[yielder() for _ in range(TASKS)])
+    ms = ticks_diff(ticks_ms(), start)
+    print(f"{name}: {TASKS * STEPS / ms:.0f} switches/ms")
+
+
+async def producer(event):
+    for _ in range(20):
+        await asyncio.sleep_ms(5)
+        event.set()
+
+
+async def consumer(event):
+    for _ in range(20):
+        await event.wait()
+        event.clear()
+        sum(range(20000))
+
+
+async def main():
+    await switches("metrics disabled")
+    asyncio.enable_metrics()
+    await switches("metrics enabled")
+    asyncio.disable_metrics()
+    await switches("metrics disabled again")
+
+    asyncio.enable_metrics()
+    event = asyncio.Event()
+    p = asyncio.create_task(producer(event))
+    c = asyncio.create_task(consumer(event))
+    await asyncio.sleep_ms(50)
+    snapshot = asyncio.metrics_snapshot()
+    await asyncio.gather(p, c)
+    asyncio.disable_metrics()
+    print(
+        f"{snapshot['resumes_per_s']:.0f} resumes/s, "
+        f"{snapshot['polls_per_s']:.0f} polls/s, lag histogram {snapshot['lag']}"
+    )
+    for task, m in snapshot["tasks"].items():
+        name = "producer" if task is p else "consumer" if task is c else "main"
+        print(f"  {name}: {m}")
+
+
+asyncio.run(main())
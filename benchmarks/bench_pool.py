@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Request rate against a local echo server, with and without a ConnectionPool.
+
+Run with ``python -m benchmarks.bench_pool``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+HOST = "127.0.0.1"
+PORT = 8765
+REQUESTS = 1000
+CLIENTS = 4
+MESSAGE = b"ping\n"
+
+
+async def echo(reader, writer):
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        writer.write(line)
+        await writer.drain()
+    await writer.wait_closed()
+
+
+async def request(reader, writer):
+    writer.write(MESSAGE)
+    await writer.drain()
+    if await reader.readline() != MESSAGE:
+        raise RuntimeError("bad echo")
+
+
+async def client_unpooled(n):
+    for _ in range(n):
+        reader, writer = await asyncio.open_connection(HOST, PORT)
+        await request(reader, writer)
+        await writer.wait_closed()
+
+
+async def client_pooled(pool, n):
+    for _ in range(n):
+        async with pool.connection(HOST, PORT) as (reader, writer):
+            await request(reader, writer)
+
+
+async def measure(make_client):
+    start = ticks_ms()
+    await asyncio.gather(*(make_client(REQUESTS // CLIENTS) for _ in range(CLIENTS)))
+    return REQUESTS * 1000 / max(1, ticks_diff(ticks_ms(), start))
+
+
+async def main():
+    server = await asyncio.start_server(echo, HOST, PORT)
+    unpooled = await measure(client_unpooled)
+    pool = asyncio.ConnectionPool(max_per_host=CLIENTS)
+    pooled = await measure(lambda n: client_pooled(pool, n))
+    await pool.close()
+    server.close()
+    await server.wait_closed()
+    print(f"unpooled: {unpooled:.0f} requests/s")
+    print(f"pooled:   {pooled:.0f} requests/s")
+
+
+asyncio.run(main())
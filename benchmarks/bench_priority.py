@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Jitter of a 10 ms control loop next to 100 busy bulk-transfer tasks, with the
+control loop at normal and at high priority, and the number of task switches per
+second with and without the priority dispatcher.
+
+Run with ``python -m benchmarks.bench_priority``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_add, ticks_diff, ticks_ms
+
+BULK = 100
+PERIOD = 10
+ITERATIONS = 100
+WORK = 2000
+SWITCH_TASKS = 10
+SWITCH_MS = 300
+
+
+def work():
+    # A short burst of work, like copying a buffer.
+    total = 0
+    for i in range(WORK):
+        total += i
+    return total
+
+
+async def bulk(stop, steps):
+    while not stop[0]:
+        work()
+        steps[0] += 1
+        await asyncio.sleep(0)
+
+
+async def control(lateness):
+    for _ in range(ITERATIONS):
+        deadline = ticks_add(ticks_ms(), PERIOD)
+        await asyncio.sleep_ms(PERIOD)
+        lateness.append(max(0, ticks_diff(ticks_ms(), deadline)))
+
+
+async def measure(name, priority):
+    stop = [False]
+    steps = [0]
+    tasks = [asyncio.create_task(bulk(stop, steps)) for _ in range(BULK)]
+    lateness = []
+    start = ticks_ms()
+    await asyncio.create_task(control(lateness), priority)
+    stop[0] = True
+    rate = steps[0] * 1000 // max(1, ticks_diff(ticks_ms(), start))
+    await asyncio.gather(*tasks)
+    mean = sum(lateness) / len(lateness)
+    print(
+        f"{name}: control loop late by {mean:.1f} ms on average, "
+        f"{max(lateness)} ms at most; {rate} bulk steps/s"
+    )
+
+
+async def switch(stop, steps):
+    while not stop[0]:
+        steps[0] += 1
+        await asyncio.sleep(0)
+
+
+async def switches(name):
+    # Task switches per second between tasks that do nothing but yield, best of 3.
+    best = 0
+    for _ in range(3):
+        stop = [False]
+        steps = [0]
+        tasks = [asyncio.create_task(switch(stop, steps)) for _ in range(SWITCH_TASKS)]
+        start = ticks_ms()
+        await asyncio.sleep_ms(SWITCH_MS)
+        best = max(best, steps[0] * 1000 // max(1, ticks_diff(ticks_ms(), start)))
+        stop[0] = True
+        await asyncio.gather(*tasks)
+    print(f"{name}: {best} switches/s")
+
+
+async def idle():
+    await asyncio.sleep(3600)
+
+
+async def dispatcher():
+    await switches("plain queue")
+    # Install the dispatcher with a task of high priority that stays asleep.
+    sleeper = asyncio.create_task(idle(), asyncio.PRIORITY_HIGH)
+    await switches("dispatcher, only normal priority ready")
+    sleeper.cancel()
+    sleeper = asyncio.create_task(switch([False], [0]), asyncio.PRIORITY_LOW)
+    await switches("dispatcher, one low priority task ready")
+    sleeper.cancel()
+
+
+async def main():
+    await measure("normal priority", asyncio.PRIORITY_NORMAL)
+    await measure("high priority", asyncio.PRIORITY_HIGH)
+    asyncio.set_priority_policy(weights=(1, 1, 4))
+    await measure("high priority, weighted 1:4", asyncio.PRIORITY_HIGH)
+
+
+asyncio.run(main())
+asyncio.new_event_loop()
+asyncio.run(dispatcher())
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Check that the sampling profiler attributes time to the right await chain.
+
+A task awaits another, whose coroutine awaits ``middle()``, which does some work
+per iteration and awaits ``inner()``, which does three times as much.  The
+amounts vary randomly, so that the work doesn't keep step with the sampling.
+The samples in ``inner`` should be about three times those in ``middle``, all
+under the chain ``main;outer;middle``.  This is checked with the sampling by
+signals and with the sampling between steps used where there are no signals.
+
+Run with ``python -m benchmarks.bench_profiler``.
+"""
+
+import asyncio
+import random
+import sys
+from asyncio import profiler
+
+ITERATIONS = 300
+WORK = 10000
+
+
+def work(n):
+    total = 0
+    for i in range(random.randint(n // 2, n * 3 // 2)):
+        total += i
+    return total
+
+
+async def inner():
+    work(3 * WORK)
+    await asyncio.sleep(0)
+
+
+async def middle():
+    for _ in range(ITERATIONS):
+        work(WORK)
+        await asyncio.sleep(0)
+        await inner()
+
+
+async def outer():
+    await middle()
+
+
+async def main():
+    await asyncio.create_task(outer())
+
+
+def check(name):
+    p = asyncio.Profiler(0.0005)
+    with p:
+        asyncio.run(main())
+    in_inner = in_middle = 0
+    for stack, n in p.stacks.items():
+        if "middle" not in stack:
+            continue
+        if not stack.startswith("main;outer;middle"):
+            print(f"{name}: unexpected stack {stack}")
+            return False
+        if "inner" in stack:
+            in_inner += n
+        else:
+            in_middle += n
+    share = in_inner / max(1, in_inner + in_middle)
+    print(f"{name}: top stacks")
+    print("".join("  " + line + "\n" for line in p.collapsed().splitlines()[:4]), end="")
+    print(f"  {in_inner} samples in inner, {in_middle} in middle, inner share {share:.2f}")
+    return 0.65 <= share <= 0.85
+
+
+def check_all():
+    ok = check("sampling by signals")
+    profiler._setitimer = None
+    ok = check("sampling between steps") and ok
+    print("attribution OK" if ok else "attribution WRONG")
+    return ok
+
+
+if not check_all():
+    sys.exit(1)
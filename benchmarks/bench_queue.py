@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Producer to consumer throughput: a hand-rolled list plus Events, a Queue, and
+a Queue with batched puts and gets.
+
+Run with ``python -m benchmarks.bench_queue``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+ITEMS = 100000
+MAXSIZE = 64
+BATCH = 16
+
+
+async def handrolled(consumers):
+    # A list plus Events, which wake every waiting task on every change.
+    items = []
+    ready = asyncio.Event()
+    space = asyncio.Event()
+    done = [0]
+
+    async def consumer():
+        while done[0] < ITEMS:
+            if not items:
+                ready.clear()
+                await ready.wait()
+                continue
+            items.pop(0)
+            space.set()
+            done[0] += 1
+
+    consumers = [asyncio.create_task(consumer()) for _ in range(consumers)]
+    for i in range(ITEMS):
+        # Backpressure, as Queue(MAXSIZE) gives.
+        while len(items) >= MAXSIZE:
+            space.clear()
+            await space.wait()
+        items.append(i)
+        ready.set()
+    while done[0] < ITEMS:
+        await asyncio.sleep(0)
+    ready.set()
+    await asyncio.gather(*consumers)
+
+
+async def queue_single(consumers):
+    q = asyncio.Queue(MAXSIZE)
+
+    async def consumer():
+        while True:
+            await q.get()
+            q.task_done()
+
+    consumers = [asyncio.create_task(consumer()) for _ in range(consumers)]
+    for i in range(ITEMS):
+        await q.put(i)
+    await q.join()
+    for t in consumers:
+        t.cancel()
+
+
+async def queue_batch(consumers):
+    q = asyncio.Queue(MAXSIZE)
+
+    async def consumer():
+        while True:
+            for _ in await q.get_many(BATCH):
+                q.task_done()
+
+    consumers = [asyncio.create_task(consumer()) for _ in range(consumers)]
+    for i in range(0, ITEMS, BATCH):
+        await q.put_many(range(i, i + BATCH))
+    await q.join()
+    for t in consumers:
+        t.cancel()
+
+
+async def measure(name, fn, consumers):
+    start = ticks_ms()
+    await fn(consumers)
+    ms = max(1, ticks_diff(ticks_ms(), start))
+    print(f"{name}, {consumers} consumers: {ITEMS * 1000 // ms} items/s")
+
+
+async def main():
+    for consumers in (4, 32):
+        await measure("list + Event", handrolled, consumers)
+        await measure("Queue put/get", queue_single, consumers)
+        await measure("Queue put_many/get_many", queue_batch, consumers)
+
+
+asyncio.run(main())
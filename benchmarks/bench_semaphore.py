@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""1k tasks competing for 10 permits: spin-waiting with sleep_ms versus a
+Semaphore.
+
+Run with ``python -m benchmarks.bench_semaphore``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+TASKS = 1000
+PERMITS = 10
+ROUNDS = 5
+
+
+class Stats:
+    def __init__(self):
+        self.in_use = 0
+        self.peak = 0
+        self.max_wait = 0
+
+    def enter(self, start):
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+        self.max_wait = max(self.max_wait, ticks_diff(ticks_ms(), start))
+
+
+async def work():
+    # Stand-in for an outbound connection.
+    await asyncio.sleep_ms(1)
+
+
+async def spin(stats):
+    for _ in range(ROUNDS):
+        start = ticks_ms()
+        while stats.in_use >= PERMITS:
+            await asyncio.sleep_ms(1)
+        stats.enter(start)
+        await work()
+        stats.in_use -= 1
+
+
+async def semaphore(stats, sem):
+    for _ in range(ROUNDS):
+        start = ticks_ms()
+        async with sem:
+            stats.enter(start)
+            await work()
+            stats.in_use -= 1
+
+
+async def measure(name, make_task):
+    stats = Stats()
+    start = ticks_ms()
+    await asyncio.gather(*(make_task(stats) for _ in range(TASKS)))
+    ms = ticks_diff(ticks_ms(), start)
+    print(f"{name}: {ms} ms, {stats.peak} held at once, longest wait {stats.max_wait} ms")
+
+
+async def main():
+    await measure("spin with sleep_ms", spin)
+    sem = asyncio.BoundedSemaphore(PERMITS)
+    await measure("Semaphore", lambda stats: semaphore(stats, sem))
+
+
+asyncio.run(main())
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Time to tear down 10k tasks after an early failure: TaskGroup against gather
+plus cancelling the siblings by hand.
+
+Run with ``python -m benchmarks.bench_taskgroup``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+N = 10000
+
+
+async def child(i):
+    if i == N // 2:
+        await asyncio.sleep_ms(1)
+        raise ValueError("early failure")
+    await asyncio.sleep(60)
+
+
+async def run_taskgroup():
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for i in range(N):
+                tg.create_task(child(i))
+    except Exception as e:
+        # An ExceptionGroup where there are exception groups, otherwise the error.
+        errors = getattr(e, "exceptions", [e])
+        assert all(isinstance(er, ValueError) for er in errors), errors
+
+
+async def run_gather():
+    tasks = [asyncio.create_task(child(i)) for i in range(N)]
+    try:
+        await asyncio.gather(*tasks)
+    except ValueError:
+        pass
+    for t in tasks:
+        t.cancel()
+    # Wait for the cancellations to be delivered.
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def measure(name, fn):
+    start = ticks_ms()
+    await fn()
+    print(f"{name}: {ticks_diff(ticks_ms(), start)} ms for {N} children")
+
+
+async def main():
+    await measure("gather + manual cancel", run_gather)
+    await measure("TaskGroup", run_taskgroup)
+
+
+asyncio.run(main())
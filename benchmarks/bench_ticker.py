@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Drift of a 10 ms periodic loop over a million periods, sleeping for the
+interval with ``sleep_ms()`` and waiting on a ``Ticker``.
+
+The event loop runs on a simulated clock, so the benchmark takes seconds rather
+than hours: each iteration of the loop does 1 to 3 ms of "work" (1 in 1000 takes
+15 ms), and each wake up is 0 to 1 ms late.  The clock starts just before the
+ticks wrap around.
+
+Run with ``python -m benchmarks.bench_ticker``.
+"""
+
+import asyncio
+import random
+from asyncio import core
+
+from adafruit_ticks import ticks_add, ticks_diff, ticks_ms
+
+PERIODS = 1000000
+PERIOD = 10
+_TICKS_MASK = (1 << 29) - 1
+
+clock = [_TICKS_MASK - 5000]
+
+
+def ticks():
+    return clock[0]
+
+
+def advance(ms):
+    clock[0] = (clock[0] + ms) & _TICKS_MASK
+
+
+def wait_io_event(self, dt):
+    # Nothing does IO, so waiting only moves the clock on, with some lag.
+    if dt > 0:
+        advance(dt + random.randint(0, 1))
+
+
+def work():
+    advance(15 if random.randint(0, 999) == 0 else random.randint(1, 3))
+
+
+async def sleeping():
+    start = ticks()
+    for _ in range(PERIODS):
+        work()
+        await asyncio.sleep_ms(PERIOD)
+    return ticks_diff(ticks(), ticks_add(start, PERIODS * PERIOD)), 0
+
+
+async def ticking():
+    ticker = asyncio.Ticker(PERIOD / 1000)
+    start = ticks()
+    async for _ in ticker:
+        work()
+        if ticker.count + ticker.skipped >= PERIODS:
+            break
+    # Time of the last tick's deadline compared with the ideal schedule, plus how
+    # late it woke.
+    drift = ticks_diff(ticker.deadline, ticks_add(start, PERIODS * PERIOD)) + ticker.late
+    return drift, ticker.skipped
+
+
+async def measure(name, fn):
+    random.seed(1)
+    start = ticks_ms()
+    drift, skipped = await fn()
+    ms = ticks_diff(ticks_ms(), start)
+    print(
+        f"{name}: drift after {PERIODS} periods {drift} ms "
+        f"({drift / PERIODS:.3f} ms per period), {skipped} skipped; took {ms} ms"
+    )
+
+
+async def main():
+    await measure("sleep_ms(interval)", sleeping)
+    await measure("Ticker", ticking)
+
+
+core.ticks = ticks
+core.IOQueue.wait_io_event = wait_io_event
+asyncio.run(main())
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Task switches per second with no tracer and with a ``TraceRecorder``, then a
+trace of a small mixed workload.
+
+Run with ``python -m benchmarks.bench_trace [trace.json]``; if a file name is
+given the trace is written to it, for viewing in https://ui.perfetto.dev.
+"""
+
+import asyncio
+import sys
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+TASKS = 100
+STEPS = 2000
+
+
+async def yielder():
+    for _ in range(STEPS):
+        await asyncio.sleep(0)
+
+
+async def switches(name):
+    start = ticks_ms()
+    await asyncio.gather(*[yielder() for _ in range(TASKS)])
+    ms = ticks_diff(ticks_ms(), start)
+    print(f"{name}: {TASKS * STEPS / ms:.0f} switches/ms")
+
+
+async def producer(queue):
+    for i in range(10):
+        await asyncio.sleep_ms(5)
+        await queue.put(i)
+
+
+async def consumer(queue, lock):
+    for _ in range(5):
+        await queue.get()
+        async with lock:
+            sum(range(20000))
+            await asyncio.sleep_ms(1)
+
+
+async def main():
+    await switches("no tracer")
+    recorder = asyncio.TraceRecorder(1024)
+    asyncio.add_tracer(recorder)
+    await switches("TraceRecorder")
+
+    recorder.clear()
+    queue = asyncio.Queue()
+    lock = asyncio.Lock()
+    await asyncio.gather(producer(queue), consumer(queue, lock), consumer(queue, lock))
+    asyncio.remove_tracer(recorder)
+    reasons = {}
+    for _, cat, name, _, _, _ in recorder.events():
+        if cat == "wait":
+            reasons[name] = reasons.get(name, 0) + 1
+    print(f"{len(recorder.events())} events, waits by reason: {reasons}")
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w") as f:
+            recorder.write(f)
+        print(f"trace written to {sys.argv[1]}")
+
+
+asyncio.run(main())
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Reacting to the completion of 10k tasks with gather, wait and as_completed.
+
+Run with ``python -m benchmarks.bench_wait``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+N = 10000
+
+
+async def job(i):
+    # Spread the completions over a few scheduler passes.
+    await asyncio.sleep_ms(i % 10)
+    return i
+
+
+def tasks():
+    return [asyncio.create_task(job(i)) for i in range(N)]
+
+
+async def run_gather():
+    await asyncio.gather(*tasks())
+
+
+async def run_wait_all():
+    await asyncio.wait(tasks())
+
+
+async def run_wait_first():
+    # Hedging: react to the first result, then cancel the rest.
+    done, pending = await asyncio.wait(tasks(), return_when=asyncio.FIRST_COMPLETED)
+    for t in pending:
+        t.cancel()
+    await asyncio.sleep_ms(20)
+
+
+async def run_as_completed():
+    async for t in asyncio.as_completed(tasks()):
+        await t
+
+
+async def measure(name, fn):
+    start = ticks_ms()
+    await fn()
+    print(f"{name}: {ticks_diff(ticks_ms(), start)} ms for {N} tasks")
+
+
+async def main():
+    await measure("gather", run_gather)
+    await measure("wait ALL_COMPLETED", run_wait_all)
+    await measure("wait FIRST_COMPLETED + cancel", run_wait_first)
+    await measure("as_completed", run_as_completed)
+
+
+asyncio.run(main())
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Operations per second of timeout-wrapped awaits.
+
+Run with ``python -m benchmarks.bench_wait_for``.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_diff, ticks_ms
+
+N = 20000
+
+
+async def quick():
+    await asyncio.sleep_ms(0)
+    return 1
+
+
+async def forever():
+    await asyncio.sleep(3600)
+
+
+async def completes():
+    # The awaited operation finishes well before the timeout.
+    for _ in range(N):
+        await asyncio.wait_for(quick(), 10)
+
+
+async def block():
+    # An ``async with asyncio.timeout()`` block around the operation.
+    for _ in range(N):
+        async with asyncio.timeout(10):
+            await quick()
+
+
+async def expires():
+    # The timeout expires first and the operation is cancelled.
+    for _ in range(N // 10):
+        try:
+            await asyncio.wait_for_ms(forever(), 0)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def event_wait_for():
+    # Heartbeat: wait for an Event that is not set, with wait_for.
+    event = asyncio.Event()
+    for _ in range(N // 10):
+        try:
+            await asyncio.wait_for_ms(event.wait(), 0)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def event_timeout():
+    # Heartbeat: wait for an Event that is not set, with its own timeout.
+    event = asyncio.Event()
+    for _ in range(N // 10):
+        await event.wait(0)
+
+
+async def setter(event):
+    while True:
+        await asyncio.sleep_ms(0)
+        event.set()
+
+
+async def event_set_wait_for():
+    # Wait for an Event that gets set before the timeout, with wait_for.
+    event = asyncio.Event()
+    task = asyncio.create_task(setter(event))
+    for _ in range(N):
+        event.clear()
+        await asyncio.wait_for(event.wait(), 10)
+    task.cancel()
+
+
+async def event_set_timeout():
+    # Wait for an Event that gets set before the timeout, with its own timeout.
+    event = asyncio.Event()
+    task = asyncio.create_task(setter(event))
+    for _ in range(N):
+        event.clear()
+        await event.wait(10)
+    task.cancel()
+
+
+async def measure(name, fn, n):
+    start = ticks_ms()
+    await fn()
+    elapsed = max(1, ticks_diff(ticks_ms(), start))
+    print(f"{name}: {n * 1000 / elapsed:.0f} ops/s")
+
+
+async def main():
+    await measure("wait_for, completes", completes, N)
+    await measure("wait_for, expires", expires, N // 10)
+    if hasattr(asyncio, "timeout"):
+        await measure("timeout block, completes", block, N)
+    await measure("Event, wait_for, set", event_set_wait_for, N)
+    await measure("Event, wait_for, expires", event_wait_for, N // 10)
+    await measure("Event.wait(timeout), set", event_set_timeout, N)
+    await measure("Event.wait(timeout), expires", event_timeout, N // 10)
+
+
+asyncio.run(main())
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Compare two result files written by `benchmarks.suite` and flag regressions.
+
+::
+
+    python -m benchmarks.compare base.json new.json [--threshold PERCENT]
+
+Prints the operations per second of each benchmark in both files and the
+change.  A benchmark whose operations per second dropped by more than
+*threshold* percent (10 by default) is a regression.  The exit status is 1 if
+there are regressions, so this can gate a CI job.
+"""
+
+import json
+import sys
+
+
+def compare(base, new, threshold=10):
+    """Compare the reports *base* and *new*, as loaded from the JSON files, and
+    return a list of ``(name, base ops/s, new ops/s, change in percent,
+    regressed)``, for the benchmarks in both.
+    """
+
+    rows = []
+    for name, b in base["results"].items():
+        n = new["results"].get(name)
+        if n is None:
+            continue
+        before = b["ops_per_sec"]
+        after = n["ops_per_sec"]
+        change = (after - before) * 100 / before if before else 0
+        rows.append((name, before, after, change, change < -threshold))
+    return rows
+
+
+def _describe(report):
+    meta = report["meta"]
+    return f"{meta['implementation']} {meta['version']} {meta['platform']}, {meta['task']}, scale {meta['scale']}"
+
+
+def main(args):
+    threshold = 10
+    if "--threshold" in args:
+        i = args.index("--threshold")
+        threshold = float(args[i + 1])
+        args = args[:i] + args[i + 2 :]
+    if len(args) != 2:
+        print(__doc__)
+        return 2
+    with open(args[0]) as f:
+        base = json.load(f)
+    with open(args[1]) as f:
+        new = json.load(f)
+    print(f"base: {_describe(base)}")
+    print(f"new:  {_describe(new)}")
+    if base["meta"]["scale"] != new["meta"]["scale"]:
+        print("warning: the runs used different scales")
+    rows = compare(base, new, threshold)
+    regressions = 0
+    print(f"{'benchmark':16} {'base ops/s':>12} {'new ops/s':>12} {'change':>8}")
+    for name, before, after, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:16} {before:12.0f} {after:12.0f} {change:+7.1f}%{flag}")
+        regressions += regressed
+    for name in new["results"]:
+        if name not in base["results"]:
+            print(f"{name:16} only in new")
+    print(f"{regressions} regression(s) beyond {threshold:g}%")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,365 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Check that implementations of ``Task`` and ``TaskQueue`` behave the same, and
+compare their speed.
+
+`asyncio.core` uses the ``Task`` and ``TaskQueue`` of the built-in ``_asyncio``
+module when there is one, and those of `asyncio.task` otherwise.  This runs a
+set of scheduling scenarios (heap order, cancellation and its forwarding to
+awaited tasks, `gather` with exceptions, `wait_for` timeouts and races...)
+against each implementation, checking the events each scenario logs against the
+expected ones, then runs `benchmarks.suite` with each and ranks them::
+
+    python -m benchmarks.parity [module ...] [--repeat N] [--scale X] [-o report.json]
+
+The implementations are `asyncio.task`, ``_asyncio`` if it has a ``TaskQueue``,
+and each *module* named, which must have ``Task`` and ``TaskQueue`` classes
+with the same interface.  The exit status is 1 if a scenario fails.
+"""
+
+import asyncio
+import json
+import sys
+from asyncio import core, task
+
+from . import suite
+
+SCENARIOS = {}
+
+
+def scenario(*expected):
+    """Add the decorated async function, which takes a list to log events to, to
+    the scenarios, to be checked against the *expected* events.
+    """
+
+    def add(fn):
+        SCENARIOS[fn.__name__] = (fn, list(expected))
+        return fn
+
+    return add
+
+
+async def _nothing():
+    pass
+
+
+def _tasks(coro, n):
+    return [core.Task(coro, core.__dict__) for _ in range(n)]
+
+
+@scenario(0, 1, 2, 3, 4, 5)
+async def queue_order(log):
+    # Tasks are popped in order of their keys, across the wrap of ticks.
+    queue = core.TaskQueue()
+    coro = _nothing()
+    base = core.ticks_add(0, -3)
+    offsets = {}
+    for t, offset in zip(_tasks(coro, 6), (5, 0, 3, 1, 4, 2)):
+        offsets[t] = offset
+        queue.push(t, core.ticks_add(base, offset))
+    while queue.peek():
+        log.append(offsets[queue.pop()])
+    coro.close()
+
+
+@scenario(1, 2, 4)
+async def queue_remove(log):
+    # Removing tasks, including the head of the heap, keeps the others in order.
+    queue = core.TaskQueue()
+    coro = _nothing()
+    tasks = _tasks(coro, 6)
+    for i, t in enumerate(tasks):
+        queue.push(t, i)
+    for i in (0, 3, 5):
+        queue.remove(tasks[i])
+    while queue.peek():
+        log.append(tasks.index(queue.pop()))
+    coro.close()
+
+
+async def _sleeper(log, ms):
+    await asyncio.sleep_ms(ms)
+    log.append(ms)
+
+
+@scenario(0, 10, 20, 30)
+async def sleep_order(log):
+    await asyncio.gather(*[_sleeper(log, ms) for ms in (30, 0, 20, 10)])
+
+
+async def _cancellable(log, name, result=None):
+    try:
+        await asyncio.sleep(10)
+    except asyncio.CancelledError:
+        log.append(name + " cancelled")
+        if result is None:
+            raise
+    return result
+
+
+@scenario(True, "sleeper cancelled", "result", False, True)
+async def cancel_sleeping(log):
+    t = asyncio.create_task(_cancellable(log, "sleeper", "result"))
+    await asyncio.sleep(0)
+    log.append(t.cancel())
+    log.append(await t)
+    log.append(t.cancel())
+    log.append(t.done())
+
+
+async def _awaiter(log, inner):
+    try:
+        await inner
+    except asyncio.CancelledError:
+        log.append("outer cancelled")
+        raise
+
+
+@scenario("inner cancelled", "outer cancelled", True, True)
+async def cancel_forwarding(log):
+    # Cancelling a task that awaits another cancels the other.
+    inner = asyncio.create_task(_cancellable(log, "inner"))
+    outer = asyncio.create_task(_awaiter(log, inner))
+    await asyncio.sleep(0)
+    outer.cancel()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    log.append(inner.done())
+    log.append(outer.done())
+
+
+async def _value(v, ms=0):
+    await asyncio.sleep_ms(ms)
+    return v
+
+
+async def _fail(ms=0):
+    await asyncio.sleep_ms(ms)
+    raise ValueError
+
+
+@scenario("ValueError", [1, "ValueError", 2])
+async def gather_exceptions(log):
+    try:
+        await asyncio.gather(_value(1), _fail(), _value(2, 5))
+    except ValueError:
+        log.append("ValueError")
+    results = await asyncio.gather(_value(1), _fail(), _value(2, 5), return_exceptions=True)
+    log.append([r if isinstance(r, int) else type(r).__name__ for r in results])
+
+
+@scenario("gather cancelled", "a cancelled", "b cancelled")
+async def gather_cancelled(log):
+    # Cancelling a task in gather() cancels what it gathers, after the task
+    # itself has been resumed with the CancelledError.
+    async def gathering():
+        try:
+            await asyncio.gather(_cancellable(log, "a"), _cancellable(log, "b"))
+        except asyncio.CancelledError:
+            log.append("gather cancelled")
+
+    t = asyncio.create_task(gathering())
+    await asyncio.sleep(0)
+    t.cancel()
+    await t
+
+
+@scenario("slow cancelled", "TimeoutError", "fast")
+async def wait_for_timeout(log):
+    try:
+        await asyncio.wait_for(_cancellable(log, "slow"), 0.01)
+    except asyncio.TimeoutError:
+        log.append("TimeoutError")
+    log.append(await asyncio.wait_for(_value("fast"), 0.01))
+
+
+@scenario("late cancelled", "late")
+async def wait_for_race(log):
+    # The awaited coroutine ignores the cancellation at the timeout and returns.
+    log.append(await asyncio.wait_for(_cancellable(log, "late", "late"), 0.01))
+
+
+@scenario("inner cancelled", "outer cancelled")
+async def wait_for_cancelled(log):
+    # Cancelling a task in wait_for() cancels what it waits for.
+    async def waiting():
+        try:
+            await asyncio.wait_for(_cancellable(log, "inner"), 10)
+        except asyncio.CancelledError:
+            log.append("outer cancelled")
+
+    t = asyncio.create_task(waiting())
+    await asyncio.sleep(0)
+    t.cancel()
+    await t
+
+
+@scenario("handler ValueError", 1, 1, "ValueError", "ValueError")
+async def await_done(log):
+    # A finished task can be awaited again, for its result or its exception.
+    # Nothing awaited the failed task when it finished, so the exception handler
+    # was called too.
+    ok = asyncio.create_task(_value(1))
+    failed = asyncio.create_task(_fail())
+    await asyncio.sleep_ms(1)
+    for t in (ok, ok, failed, failed):
+        try:
+            log.append(await t)
+        except ValueError:
+            log.append("ValueError")
+
+
+def implementations(names=()):
+    """Return a dict mapping the name of each implementation to its module.
+    Raises ``ValueError`` if a module named in *names* can't be imported or has
+    no ``Task`` and ``TaskQueue``.
+    """
+
+    impls = {"asyncio.task": task}
+    try:
+        native = __import__("_asyncio")
+        if hasattr(native, "TaskQueue"):
+            impls["_asyncio"] = native
+    except ImportError:
+        pass
+    for name in names:
+        if name in impls:
+            continue
+        try:
+            impl = __import__(name, None, None, ["Task"])
+        except ImportError:
+            raise ValueError("can't import " + name) from None
+        if not hasattr(impl, "Task") or not hasattr(impl, "TaskQueue"):
+            raise ValueError(name + " has no Task and TaskQueue")
+        impls[name] = impl
+    return impls
+
+
+def use(impl):
+    """Make the event loop use the ``Task`` and ``TaskQueue`` of module *impl*,
+    and reset it.
+    """
+
+    core.Task = impl.Task
+    core.TaskQueue = impl.TaskQueue
+    asyncio.new_event_loop()
+
+
+def check(name):
+    """Run scenario *name* with the current implementation and return the
+    events it logged, including calls to the exception handler, ending with the
+    name of the exception if it raised one.
+    """
+
+    log = []
+    loop = asyncio.new_event_loop()
+    loop.set_exception_handler(
+        lambda loop, context: log.append("handler " + type(context["exception"]).__name__)
+    )
+    try:
+        asyncio.run(SCENARIOS[name][0](log))
+    except Exception as e:
+        log.append("raised " + type(e).__name__)
+    finally:
+        loop.set_exception_handler(None)
+    return log
+
+
+USAGE = "usage: python -m benchmarks.parity [module ...] [--repeat N] [--scale X] [-o report.json]"
+
+
+def main(args):
+    repeat = 3
+    scale = 0.5
+    out = None
+    modules = []
+    i = 0
+    try:
+        while i < len(args):
+            arg = args[i]
+            if arg in {"-h", "--help"}:
+                print(USAGE)
+                return 0
+            if arg in {"-o", "--repeat", "--scale"}:
+                if i + 1 == len(args):
+                    raise ValueError(arg + " needs a value")
+                value = args[i + 1]
+                if arg == "-o":
+                    out = value
+                elif arg == "--repeat":
+                    repeat = int(value)
+                else:
+                    scale = float(value)
+                i += 2
+                continue
+            if arg.startswith("-"):
+                raise ValueError("unknown option " + arg)
+            modules.append(arg)
+            i += 1
+        impls = implementations(modules)
+    except ValueError as e:
+        print(e)
+        print(USAGE)
+        return 2
+    original = (core.Task, core.TaskQueue)
+    report = {"conformance": {}, "performance": {}}
+    failures = 0
+    try:
+        for impl_name, impl in impls.items():
+            use(impl)
+            print(f"{impl_name}:")
+            results = report["conformance"][impl_name] = {}
+            for name, (_, expected) in SCENARIOS.items():
+                log = check(name)
+                ok = log == expected
+                results[name] = ok
+                if ok:
+                    print(f"  {name:20} ok")
+                else:
+                    failures += 1
+                    print(f"  {name:20} FAILED: logged {log}, expected {expected}")
+        for impl_name, impl in impls.items():
+            use(impl)
+            report["performance"][impl_name] = suite.run_all(None, repeat, scale, log=False)
+    finally:
+        core.Task, core.TaskQueue = original
+        asyncio.new_event_loop()
+    _rank(report["performance"])
+    if out is not None:
+        with open(out, "w") as f:
+            json.dump(report, f)
+        print(f"report written to {out}")
+    print(f"{failures} scenario(s) failed")
+    return 1 if failures else 0
+
+
+def _rank(performance):
+    # Print the ops/s of each benchmark per implementation, relative to the
+    # first, and rank the implementations by the geometric mean of the ratios.
+    names = list(performance)
+    first = performance[names[0]]["results"]
+    print(f"{'benchmark':16}" + "".join(f" {name:>16}" for name in names))
+    products = dict.fromkeys(names, 1.0)
+    count = 0
+    for bench, base in first.items():
+        row = f"{bench:16}"
+        for name in names:
+            r = performance[name]["results"].get(bench)
+            if r is None:
+                row += f" {'-':>16}"
+                continue
+            ratio = r["ops_per_sec"] / base["ops_per_sec"]
+            products[name] *= ratio
+            row += f" {r['ops_per_sec']:9.0f} {ratio:5.2f}x"
+        count += 1
+        print(row)
+    means = [(products[name] ** (1 / max(1, count)), name) for name in names]
+    means.sort(reverse=True)
+    for rank, (mean, name) in enumerate(means, 1):
+        print(f"{rank}. {name}: {mean:.2f}x {names[0]} (geometric mean)")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,271 @@
+# SPDX-FileCopyrightText: 2026 by Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Micro- and macro-benchmarks of the scheduler, primitives and streams, with
+results as JSON.
+
+Each benchmark runs on a fresh event loop *repeat* times, and the best time is
+kept, as operations per second.  Run them all, or the ones named::
+
+    python -m benchmarks.suite [-o results.json] [--repeat N] [--scale X] [name ...]
+
+*scale* multiplies the number of operations of each benchmark; use a fraction on
+microcontrollers.  Compare two result files with `benchmarks.compare`.  This runs
+on CPython and on MicroPython or CircuitPython where the modules used exist;
+``stream_echo`` is skipped where there is no ``socket.socketpair()``.
+"""
+
+import asyncio
+import json
+import random
+import sys
+from asyncio import core
+
+try:
+    from time import perf_counter as _now
+
+    def _elapsed(start):
+        return _now() - start
+
+except ImportError:
+    from time import ticks_diff, ticks_us
+
+    _now = ticks_us
+
+    def _elapsed(start):
+        return ticks_diff(ticks_us(), start) / 1000000
+
+
+BENCHMARKS = {}
+
+
+def benchmark(fn):
+    """Add *fn*, an async function taking the scale and returning the number of
+    operations it did, to the suite under its name without ``bench_``.
+    """
+
+    BENCHMARKS[fn.__name__[6:]] = fn
+    return fn
+
+
+def _n(scale, n):
+    return max(1, int(n * scale))
+
+
+async def _nothing():
+    pass
+
+
+async def _quick():
+    await asyncio.sleep_ms(0)
+    return 1
+
+
+@benchmark
+async def bench_create_task(scale):
+    # Tasks created and run to completion, in batches of 100.
+    n = _n(scale, 200)
+    for _ in range(n):
+        for _ in range(100):
+            asyncio.create_task(_nothing())
+        await asyncio.sleep_ms(0)
+    return n * 100
+
+
+async def _pinger(n):
+    for _ in range(n):
+        await asyncio.sleep_ms(0)
+
+
+@benchmark
+async def bench_pingpong(scale):
+    # Task switches between two tasks that yield with sleep_ms(0).
+    n = _n(scale, 20000)
+    await asyncio.gather(_pinger(n), _pinger(n))
+    return 2 * n
+
+
+@benchmark
+async def bench_timer_heap(scale):
+    # Pushes and pops of 10k tasks with random deadlines on a TaskQueue, the
+    # heap that sleeping tasks wait on.
+    n = _n(scale, 10000)
+    coro = _nothing()
+    tasks = [core.Task(coro, core.__dict__) for _ in range(n)]
+    keys = [random.randint(0, 1 << 20) for _ in range(n)]
+    queue = core.TaskQueue()
+    for _ in range(3):
+        for i in range(n):
+            queue.push(tasks[i], keys[i])
+        while queue.peek():
+            queue.pop()
+    coro.close()
+    return 3 * n
+
+
+async def _waiter(event):
+    await event.wait()
+
+
+@benchmark
+async def bench_event_fanout(scale):
+    # Tasks woken by Event.set(), 1000 at a time.
+    rounds = _n(scale, 20)
+    for _ in range(rounds):
+        event = asyncio.Event()
+        tasks = [asyncio.create_task(_waiter(event)) for _ in range(1000)]
+        await asyncio.sleep_ms(0)
+        event.set()
+        await asyncio.gather(*tasks)
+    return rounds * 1000
+
+
+async def _locker(lock, n):
+    for _ in range(n):
+        async with lock:
+            await asyncio.sleep_ms(0)
+
+
+@benchmark
+async def bench_lock_contention(scale):
+    # Lock acquisitions by 50 tasks that each hold it over a yield.
+    n = _n(scale, 200)
+    lock = asyncio.Lock()
+    await asyncio.gather(*[_locker(lock, n) for _ in range(50)])
+    return 50 * n
+
+
+@benchmark
+async def bench_gather(scale):
+    # Coroutines run by gather(), 1000 at a time.
+    rounds = _n(scale, 20)
+    for _ in range(rounds):
+        await asyncio.gather(*[_quick() for _ in range(1000)])
+    return rounds * 1000
+
+
+@benchmark
+async def bench_wait_for(scale):
+    # wait_for() calls on coroutines that finish before the timeout.
+    n = _n(scale, 10000)
+    for _ in range(n):
+        await asyncio.wait_for(_quick(), 10)
+    return n
+
+
+async def _echo(stream, n, size):
+    for _ in range(n):
+        data = await stream.readexactly(size)
+        stream.write(data)
+        await stream.drain()
+
+
+@benchmark
+async def bench_stream_echo(scale):
+    # Round trips of 64 bytes between two Streams over a socket pair.
+    import socket
+
+    n = _n(scale, 5000)
+    a, b = socket.socketpair()
+    a.setblocking(False)
+    b.setblocking(False)
+    client = asyncio.StreamWriter(a)
+    server = asyncio.StreamWriter(b)
+    echo = asyncio.create_task(_echo(server, n, 64))
+    message = b"x" * 64
+    for _ in range(n):
+        client.write(message)
+        await client.drain()
+        await client.readexactly(64)
+    await echo
+    client.close()
+    server.close()
+    return n
+
+
+def run(name, repeat=5, scale=1):
+    """Run the benchmark called *name* *repeat* times and return its result, a
+    dict of ``ops``, ``best`` and ``mean`` (in seconds) and ``ops_per_sec``.
+    """
+
+    fn = BENCHMARKS[name]
+    times = []
+    for _ in range(repeat):
+        asyncio.new_event_loop()
+        start = _now()
+        ops = asyncio.run(fn(scale))
+        times.append(_elapsed(start))
+    best = min(times)
+    return {
+        "ops": ops,
+        "best": best,
+        "mean": sum(times) / len(times),
+        "ops_per_sec": ops / best if best > 0 else 0,
+    }
+
+
+def run_all(names=None, repeat=5, scale=1, log=True):
+    """Run the benchmarks named, or all of them, and return the results as a
+    dict ready for JSON: ``meta`` describing the run and ``results`` mapping
+    each name to what `run` returned.  Benchmarks that fail, for instance for a
+    missing module, are left out and listed in ``meta["skipped"]``.
+    """
+
+    impl = sys.implementation
+    meta = {
+        "implementation": impl.name,
+        "version": ".".join(str(v) for v in impl.version[:3]),
+        "platform": sys.platform,
+        "task": getattr(core.Task, "__module__", "native"),
+        "repeat": repeat,
+        "scale": scale,
+        "skipped": [],
+    }
+    results = {}
+    for name in names or BENCHMARKS:
+        try:
+            results[name] = r = run(name, repeat, scale)
+        except (ImportError, AttributeError, OSError) as e:
+            meta["skipped"].append(name)
+            if log:
+                print(f"{name:16} skipped: {type(e).__name__}: {e}")
+            continue
+        if log:
+            print(f"{name:16} {r['ops_per_sec']:12.0f} ops/s  best {r['best'] * 1000:9.2f} ms")
+    return {"meta": meta, "results": results}
+
+
+def main(args):
+    out = None
+    repeat = 5
+    scale = 1
+    names = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in {"-o", "--repeat", "--scale"} and i + 1 < len(args):
+            value = args[i + 1]
+            if arg == "-o":
+                out = value
+            elif arg == "--repeat":
+                repeat = int(value)
+            else:
+                scale = float(value)
+            i += 2
+            continue
+        if arg not in BENCHMARKS:
+            print(f"unknown benchmark {arg}; one of: {' '.join(BENCHMARKS)}")
+            return 2
+        names.append(arg)
+        i += 1
+    report = run_all(names, repeat, scale)
+    if out is not None:
+        with open(out, "w") as f:
+            json.dump(report, f)
+        print(f"results written to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))